@@ -0,0 +1,190 @@
+"""Versioned model artifact bundle.
+
+A bundle is one folder written by model/model.py::
+
+    carbon_bundle/
+        manifest.json   format version, checksums and the full feature schema
+        model.joblib    the fitted regressor, stored uncompressed
+
+Encoder classes and scaler parameters live in the manifest as plain JSON, so
+only the model itself is ever unpickled. Each part loads lazily on first use.
+
+The model is not memory-mapped: sklearn trees copy their node arrays into
+their own buffers when unpickled and XGBoost pickles a raw booster buffer, so
+``mmap_mode`` would not share any pages between worker processes.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+from encoding import EncodingTables, UNKNOWN_FIRST
+from predictor import BatchPredictor, CATEGORICAL_COLS, FEATURE_COLS, NUMERICAL_COLS
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+MODEL_FILE = "model.joblib"
+
+
+def file_sha256(path, block_size=1 << 20):
+    """SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_bundle(bundle_dir, model, encoders, scaler, feature_cols=None):
+    """Write ``model``, ``encoders`` and ``scaler`` as a versioned bundle in ``bundle_dir``."""
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    model_path = bundle_dir / MODEL_FILE
+    # Uncompressed: loading skips decompression
+    joblib.dump(model, model_path, compress=0)
+
+    manifest = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "model_class": f"{type(model).__module__}.{type(model).__name__}",
+        "files": {MODEL_FILE: {"sha256": file_sha256(model_path), "bytes": model_path.stat().st_size}},
+        "schema": {
+            "feature_cols": list(feature_cols or getattr(model, "feature_names_in_", FEATURE_COLS)),
+            "categorical": {col: [str(c) for c in encoders[col].classes_] for col in CATEGORICAL_COLS if col in encoders},
+            "numerical": list(getattr(scaler, "feature_names_in_", NUMERICAL_COLS)),
+            "scaler": {"mean": scaler.mean_.tolist(), "scale": scaler.scale_.tolist()},
+        },
+    }
+    # Write the manifest last so a half-written bundle is never picked up
+    tmp_path = bundle_dir / (MANIFEST_FILE + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, bundle_dir / MANIFEST_FILE)
+    return manifest
+
+
+class ScalerParams:
+    """The parts of a fitted StandardScaler that BatchPredictor needs."""
+
+    def __init__(self, mean, scale, feature_names):
+        self.mean_ = np.asarray(mean, dtype=np.float64)
+        self.scale_ = np.asarray(scale, dtype=np.float64)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+
+class ArtifactBundle:
+    """Lazy reader for a bundle folder. Nothing is read until a part is used."""
+
+    def __init__(self, bundle_dir, verify=False, unknown=UNKNOWN_FIRST):
+        self.bundle_dir = Path(bundle_dir)
+        self.verify_on_load = verify
+        self.unknown = unknown
+        self._manifest = None
+        self._model = None
+        self._encoding = None
+        self._scaler = None
+        self._predictor = None
+
+    def available(self):
+        return (self.bundle_dir / MANIFEST_FILE).is_file()
+
+    @property
+    def manifest(self):
+        if self._manifest is None:
+            manifest = json.loads((self.bundle_dir / MANIFEST_FILE).read_text())
+            if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported bundle format {manifest.get('format_version')} "
+                    f"(expected {BUNDLE_FORMAT_VERSION}) in {self.bundle_dir}"
+                )
+            self._manifest = manifest
+        return self._manifest
+
+    @property
+    def schema(self):
+        return self.manifest["schema"]
+
+    def verify(self):
+        """Check every file against the manifest checksums. Raises ValueError on mismatch."""
+        for name, info in self.manifest["files"].items():
+            actual = file_sha256(self.bundle_dir / name)
+            if actual != info["sha256"]:
+                raise ValueError(f"Checksum mismatch for {name} in {self.bundle_dir}")
+
+    @property
+    def model(self):
+        if self._model is None:
+            if self.verify_on_load:
+                self.verify()
+            self._model = joblib.load(self.bundle_dir / MODEL_FILE)
+        return self._model
+
+    @property
+    def encoding(self):
+        if self._encoding is None:
+            self._encoding = EncodingTables.from_classes(self.schema["categorical"], self.unknown)
+        return self._encoding
+
+    @property
+    def scaler(self):
+        if self._scaler is None:
+            params = self.schema["scaler"]
+            self._scaler = ScalerParams(params["mean"], params["scale"], self.schema["numerical"])
+        return self._scaler
+
+    @property
+    def predictor(self):
+        if self._predictor is None:
+            self._predictor = BatchPredictor(self.model, self.encoding, self.scaler)
+        return self._predictor
+
+
+class LegacyArtifacts:
+    """Same lazy interface over the old carbon_model.pkl / encoders.pkl / scaler.pkl trio."""
+
+    def __init__(self, model_dir=".", unknown=UNKNOWN_FIRST):
+        self.model_dir = Path(model_dir)
+        self.unknown = unknown
+        self._model = None
+        self._encoders = None
+        self._scaler = None
+        self._predictor = None
+
+    def available(self):
+        return all((self.model_dir / name).is_file() for name in ("carbon_model.pkl", "encoders.pkl", "scaler.pkl"))
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = joblib.load(self.model_dir / "carbon_model.pkl")
+        return self._model
+
+    @property
+    def encoding(self):
+        if self._encoders is None:
+            self._encoders = EncodingTables.from_encoders(joblib.load(self.model_dir / "encoders.pkl"), self.unknown)
+        return self._encoders
+
+    @property
+    def scaler(self):
+        if self._scaler is None:
+            self._scaler = joblib.load(self.model_dir / "scaler.pkl")
+        return self._scaler
+
+    @property
+    def predictor(self):
+        if self._predictor is None:
+            self._predictor = BatchPredictor(self.model, self.encoding, self.scaler)
+        return self._predictor
+
+
+def load_artifacts(bundle_dir="carbon_bundle", legacy_dir=".", verify=False):
+    """Prefer the versioned bundle, falling back to the three legacy pickles."""
+    bundle = ArtifactBundle(bundle_dir, verify=verify)
+    if bundle.available():
+        return bundle
+    return LegacyArtifacts(legacy_dir)
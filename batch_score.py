@@ -0,0 +1,154 @@
+"""Headless bulk scoring for survey files shaped like "Carbon Emission.csv".
+
+Example:
+    python batch_score.py surveys.csv predictions.csv --chunk-size 50000 --workers 8
+    python batch_score.py surveys.csv predictions.parquet --impacts
+"""
+import argparse
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from artifact_bundle import ArtifactBundle, load_artifacts
+from impact import compute_impacts
+from predictor import DEFAULT_CHUNK_SIZE
+
+PREDICTION_COL = "PredictedCarbonEmission"
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Each worker process keeps its own predictor, loaded once by the initializer
+_worker_predictor = None
+
+
+def load_batch_predictor(bundle_dir="carbon_bundle", model_dir=".", verify=True):
+    """Load the artifact bundle (or the legacy pickles in ``model_dir``) for scoring."""
+    artifacts = load_artifacts(bundle_dir, model_dir, verify=verify)
+    model = artifacts.model
+
+    # One model thread per process: the pool already spreads work over the cores
+    if hasattr(model, "set_params") and "n_jobs" in model.get_params():
+        model.set_params(n_jobs=1)
+    return artifacts.predictor
+
+
+def _init_worker(bundle_dir, model_dir):
+    global _worker_predictor
+    # score_file verified the bundle once already; workers just load it
+    _worker_predictor = load_batch_predictor(bundle_dir, model_dir, verify=False)
+
+
+def _score_chunk(chunk, impacts=False):
+    chunk[PREDICTION_COL] = _worker_predictor.predict_batch(chunk)
+    if impacts:
+        for name, values in compute_impacts(chunk[PREDICTION_COL].to_numpy()).items():
+            chunk[name] = values
+    return chunk
+
+
+def iter_chunks(path, chunk_size):
+    """Stream a CSV or Parquet file as DataFrames of at most ``chunk_size`` rows."""
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        import pyarrow.parquet as pq  # type: ignore
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class PredictionWriter:
+    """Appends scored chunks to a CSV or Parquet file as they come in."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.parquet = self.path.suffix.lower() in (".parquet", ".pq")
+        self._writer = None
+        self._wrote_header = False
+        if self.path.exists():
+            self.path.unlink()
+
+    def write(self, df):
+        if self.parquet:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode="a", header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def score_file(input_path, output_path, bundle_dir="carbon_bundle", model_dir=".",
+               chunk_size=DEFAULT_CHUNK_SIZE, workers=None, impacts=False):
+    """Score ``input_path`` chunk by chunk and write predictions to ``output_path``.
+
+    At most ``2 * workers`` chunks are in flight at any time, so memory stays
+    flat no matter how large the input is. Output rows keep the input order.
+    With ``impacts=True`` the impact metrics (trees, sea level, forest area...)
+    are added next to each prediction.
+
+    Returns:
+        int: Number of rows scored.
+    """
+    workers = workers or os.cpu_count() or 1
+    bundle = ArtifactBundle(bundle_dir)
+    if bundle.available():
+        bundle.verify()
+    writer = PredictionWriter(output_path)
+    total_rows = 0
+    started = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(bundle_dir), str(model_dir))) as pool:
+            pending = deque()
+            for chunk in iter_chunks(input_path, chunk_size):
+                pending.append(pool.submit(_score_chunk, chunk, impacts))
+                if len(pending) >= 2 * workers:
+                    scored = pending.popleft().result()
+                    writer.write(scored)
+                    total_rows += len(scored)
+                    logging.info(f"Scored {total_rows} rows...")
+            while pending:
+                scored = pending.popleft().result()
+                writer.write(scored)
+                total_rows += len(scored)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    logging.info(f"Scored {total_rows} rows in {elapsed:.1f}s ({total_rows / max(elapsed, 1e-9):.0f} rows/s)")
+    return total_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-score carbon footprint survey files.")
+    parser.add_argument("input", help="CSV or Parquet file with the 'Carbon Emission.csv' columns")
+    parser.add_argument("output", help="Where to write predictions (.csv or .parquet)")
+    parser.add_argument("--bundle-dir", default="carbon_bundle", help="Artifact bundle written by model/model.py")
+    parser.add_argument("--model-dir", default=".", help="Fallback folder holding carbon_model.pkl, encoders.pkl and scaler.pkl")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--impacts", action="store_true", help="Also write the impact metrics for each prediction")
+    args = parser.parse_args(argv)
+
+    score_file(args.input, args.output, bundle_dir=args.bundle_dir, model_dir=args.model_dir,
+               chunk_size=args.chunk_size, workers=args.workers, impacts=args.impacts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Named, versioned CO₂ conversion factors shared by every page and batch job.
+
+The factor sets live in ``data/conversion_factors.json`` and are read once
+per process. Pick a set by name, or set ECOX_FACTOR_SET to change the default.
+Add a new set instead of editing one in place, so older numbers can still be
+reproduced.
+"""
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+FACTORS_PATH = Path(os.getenv(
+    "ECOX_FACTORS_PATH", Path(__file__).resolve().parent / "data" / "conversion_factors.json"
+))
+M2_PER_HECTARE = 10000
+
+
+@dataclass(frozen=True)
+class FactorSet:
+    name: str
+    description: str
+    co2_kg_per_forest_hectare: float
+    tree_sequestration_kg: dict
+    sea_level_um_per_kg: float
+    global_average_annual_kg: float
+
+    def forest_area_ha(self, co2_kg):
+        """Forest area (hectares) that ``co2_kg`` corresponds to (scalar or array)."""
+        return np.asarray(co2_kg, dtype=np.float64) / self.co2_kg_per_forest_hectare
+
+    def forest_area_m2(self, co2_kg):
+        """Forest area (m²) that ``co2_kg`` corresponds to (scalar or array)."""
+        return self.forest_area_ha(co2_kg) * M2_PER_HECTARE
+
+    def trees(self, co2_kg, species):
+        """Whole trees of ``species`` needed to sequester ``co2_kg`` (rounded half to even)."""
+        return np.rint(np.asarray(co2_kg, dtype=np.float64) / self.tree_sequestration_kg[species]).astype(np.int64)
+
+    def sea_level_um(self, co2_kg):
+        """Sea level rise in micrometres attributed to ``co2_kg``."""
+        return np.asarray(co2_kg, dtype=np.float64) * self.sea_level_um_per_kg
+
+
+@lru_cache(maxsize=None)
+def load_factor_sets(path=FACTORS_PATH):
+    """
+    Read the factor file once.
+
+    Returns:
+        tuple: (default set name, {name: FactorSet})
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    sets = {
+        name: FactorSet(
+            name=name,
+            description=values.get("description", ""),
+            co2_kg_per_forest_hectare=float(values["co2_kg_per_forest_hectare"]),
+            tree_sequestration_kg={k: float(v) for k, v in values["tree_sequestration_kg"].items()},
+            sea_level_um_per_kg=float(values["sea_level_um_per_kg"]),
+            global_average_annual_kg=float(values["global_average_annual_kg"]),
+        )
+        for name, values in data["sets"].items()
+    }
+    return data["default"], sets
+
+
+def get_factors(name=None):
+    """The factor set called ``name`` (default: ECOX_FACTOR_SET, then the file's default)."""
+    default, sets = load_factor_sets()
+    name = name or os.getenv("ECOX_FACTOR_SET") or default
+    try:
+        return sets[name]
+    except KeyError:
+        raise ValueError(f"Unknown conversion factor set '{name}', expected one of {sorted(sets)}") from None
+
+
+def factor_set_names():
+    return list(load_factor_sets()[1])
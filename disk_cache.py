@@ -0,0 +1,107 @@
+"""Small persistent key/value cache on SQLite, shared by the app's API helpers.
+
+Entries expire after ``ttl`` seconds and the least recently used ones are
+evicted once a namespace holds more than ``max_entries``. Values must be
+JSON-serializable. Safe to share between threads and Streamlit sessions.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.getenv("ECOX_CACHE_PATH", os.path.join(".ecox_cache", "cache.sqlite"))
+
+
+def make_key(*parts):
+    """Stable hash key from any JSON-serializable parts."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, namespace="default", ttl=7 * 24 * 3600, max_entries=1000):
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT, key TEXT, value TEXT, created REAL, accessed REAL,
+                PRIMARY KEY (namespace, key)
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, accessed)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+                namespace TEXT PRIMARY KEY, hits INTEGER DEFAULT 0, misses INTEGER DEFAULT 0
+            )""")
+        self._conn.execute("INSERT OR IGNORE INTO stats (namespace) VALUES (?)", (namespace,))
+
+    def _count(self, column):
+        self._conn.execute(f"UPDATE stats SET {column} = {column} + 1 WHERE namespace = ?", (self.namespace,))
+
+    def get(self, key, count=True):
+        """Return the cached value, or None when missing or expired.
+
+        ``count=False`` leaves the hit/miss counters alone, for a second look at a key already counted.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).fetchone()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                if row is not None:
+                    self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+                if count:
+                    self._count("misses")
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?", (now, self.namespace, key)
+            )
+            if count:
+                self._count("hits")
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND created < ?", (self.namespace, now - self.ttl)
+            )
+        if self.max_entries is not None:
+            self._conn.execute("""
+                DELETE FROM entries WHERE namespace = ? AND key IN (
+                    SELECT key FROM entries WHERE namespace = ? ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                )""", (self.namespace, self.namespace, self.max_entries))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+
+    def stats(self):
+        """Hit/miss counters and current size for this namespace."""
+        with self._lock:
+            hits, misses = self._conn.execute(
+                "SELECT hits, misses FROM stats WHERE namespace = ?", (self.namespace,)
+            ).fetchone()
+            size = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "entries": size, "hit_rate": hits / total if total else 0.0}
@@ -0,0 +1,110 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Unknown-category policies
+UNKNOWN_FIRST = "first"   # map to code 0 (what the app has always done)
+UNKNOWN_ERROR = "error"   # raise ValueError listing the unseen values
+# Any other policy value is treated as a known category to fall back to, e.g. "None"
+
+
+class CategoryEncoder:
+    """Precompiled lookup for one categorical column.
+
+    Built from a fitted LabelEncoder's ``classes_`` so codes match training
+    exactly, but encoding is a dict/hash lookup with no exceptions on unseen values.
+    """
+
+    def __init__(self, column, classes, unknown=UNKNOWN_FIRST):
+        self.column = column
+        self.classes = [str(c) for c in classes]
+        self.codes = {value: code for code, value in enumerate(self.classes)}
+        self.index = pd.Index(self.classes)
+        self.unknown = unknown
+        self.unknown_count = 0
+        # Tables are shared across sessions (st.cache_resource), so counting must be atomic
+        self._count_lock = threading.Lock()
+
+        if unknown == UNKNOWN_FIRST:
+            self.unknown_code = 0
+        elif unknown == UNKNOWN_ERROR:
+            self.unknown_code = None
+        elif unknown in self.codes:
+            self.unknown_code = self.codes[unknown]
+        else:
+            raise ValueError(f"Unknown-category fallback '{unknown}' is not a known class of '{column}'")
+
+    def _unseen(self, values):
+        raise ValueError(f"Unseen categories in '{self.column}': {sorted(set(map(str, values)))[:10]}")
+
+    def _count_unknown(self, n):
+        with self._count_lock:
+            self.unknown_count += n
+
+    def encode_value(self, value):
+        """Encode a single value (fast path for one-row requests)."""
+        code = self.codes.get(str(value))
+        if code is None:
+            if self.unknown_code is None:
+                self._unseen([value])
+            self._count_unknown(1)
+            return self.unknown_code
+        return code
+
+    def encode(self, values):
+        """Encode a whole column (array-like of strings) in one vectorized lookup."""
+        values = np.asarray(values, dtype=object).astype(str)
+        codes = self.index.get_indexer(values)
+        missing = codes < 0
+        if missing.any():
+            if self.unknown_code is None:
+                self._unseen(values[missing])
+            self._count_unknown(int(missing.sum()))
+            codes[missing] = self.unknown_code
+        return codes
+
+
+class EncodingTables:
+    """All categorical lookups for the model, built once and reused per request."""
+
+    def __init__(self, encoders):
+        self.encoders = encoders
+
+    @classmethod
+    def from_classes(cls, classes_by_column, unknown=UNKNOWN_FIRST):
+        """Build from ``{column: [classes...]}``. ``unknown`` may be one policy or a per-column dict."""
+        return cls({
+            col: CategoryEncoder(col, classes, unknown.get(col, UNKNOWN_FIRST) if isinstance(unknown, dict) else unknown)
+            for col, classes in classes_by_column.items()
+        })
+
+    @classmethod
+    def from_encoders(cls, label_encoders, unknown=UNKNOWN_FIRST):
+        """Build from the ``encoders.pkl`` dict of fitted sklearn LabelEncoders."""
+        return cls.from_classes({col: enc.classes_ for col, enc in label_encoders.items()}, unknown)
+
+    def __contains__(self, column):
+        return column in self.encoders
+
+    def __getitem__(self, column):
+        return self.encoders[column]
+
+    def encode_row(self, record):
+        """Encode the categorical fields of one dict, leaving the others untouched."""
+        encoded = dict(record)
+        for col, encoder in self.encoders.items():
+            encoded[col] = encoder.encode_value(record.get(col, "None"))
+        return encoded
+
+    def transform(self, df):
+        """Encode every known categorical column of ``df``. Returns ``{column: codes}``."""
+        n = len(df)
+        return {
+            col: encoder.encode(df[col].fillna("None").to_numpy() if col in df else np.full(n, "None", dtype=object))
+            for col, encoder in self.encoders.items()
+        }
+
+    def unknown_counts(self):
+        """How many unseen values each column has bucketed so far."""
+        return {col: encoder.unknown_count for col, encoder in self.encoders.items()}
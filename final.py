@@ -1,29 +1,33 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
-import time
 from streamlit_lottie import st_lottie
 import requests
-import base64
 from pathlib import Path
 import google.generativeai as genai
 import matplotlib.pyplot as plt
 import os
+import time
 import warnings
-import subprocess
-import sys
 import plotly.express as px # type: ignore
-import folium # type: ignore
-from streamlit_folium import folium_static # type: ignore
-from io import BytesIO
-from reportlab.lib.pagesizes import letter # type: ignore
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle # type: ignore
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle # type: ignore
-from reportlab.lib import colors # type: ignore
-from docx import Document # type: ignore
+import streamlit.components.v1 as components
 import markdown
 from streamlit_mic_recorder import mic_recorder, speech_to_text
+from artifact_bundle import load_artifacts
+from lottie_assets import LottieAssets
+from suggestions import SuggestionEngine, StubClient, default_cache, fallback_suggestion
+from stage_timer import StageTimer
+from news_store import ArticleStore
+from scrape_jobs import NEWS_CSV, news_scrape_job
+from report_export import MIME_TYPES, ReportExporter
+from report_stream import FakeStreamingClient, ReportStreamer, clean_report
+from report_cache import default_report_cache, report_key
+from search_client import default_search_client
+from impact import forest_area_m2, impact_summary
+from conversion_factors import get_factors
+from forest_maps import ForestMapRenderer, fit_zoom
+from forest_registry import DEFAULT_FORESTS_PATH, ForestRegistry
+from forest_geometry import loss_polygon
 
 # Set page configuration
 st.set_page_config(
@@ -45,12 +49,19 @@ background_image = """
 """
 st.markdown(background_image, unsafe_allow_html=True)
 
-# Function to load Lottie animations
-def load_lottieurl(url):
-    r = requests.get(url)
-    if r.status_code != 200:
-        return None
-    return r.json()
+# Lottie animations: bundled in assets/lottie, served from memory, refreshed in the background
+@st.cache_resource
+def load_lottie_assets():
+    assets = LottieAssets()
+    assets.prefetch_in_background()
+    return assets
+
+lottie_assets = load_lottie_assets()
+
+# Production switches: ECOX_NO_ANIMATION=1 hides the progress bar and Lottie animations,
+# ECOX_SHOW_TIMINGS=1 shows the per-stage timing breakdown under the results
+ANIMATIONS = os.getenv("ECOX_NO_ANIMATION") != "1"
+SHOW_TIMINGS = os.getenv("ECOX_SHOW_TIMINGS") == "1"
 
 # Function to calculate BMI and determine body type
 def calculate_body_type(weight, height):
@@ -71,14 +82,11 @@ def calculate_body_type(weight, height):
 def calculate_and_display_impact(co2_footprint_kg):
     """Calculates and displays the tree and sea level impact of a CO2 footprint."""
 
-    # Tree Calculations
-    peepal_sequestration = 30  # kg CO2 per tree
-    mahogany_sequestration = 22.5  # kg CO2 per tree
-    teak_sequestration = 40  # kg CO2 per tree
-    annual_co2_kg = co2_footprint_kg * 12
-    peepal_trees = round(co2_footprint_kg / peepal_sequestration)
-    mahogany_trees = round(co2_footprint_kg / mahogany_sequestration)
-    teak_trees = round(co2_footprint_kg / teak_sequestration)
+    # Tree and sea level calculations
+    impact = impact_summary(co2_footprint_kg)
+    peepal_trees = impact["peepal_trees"]
+    mahogany_trees = impact["mahogany_trees"]
+    teak_trees = impact["teak_trees"]
 
     # 🌳 Tree Impact Message
     tree_message = f"""
@@ -97,9 +105,9 @@ def calculate_and_display_impact(co2_footprint_kg):
     </div>
     """
 
-    # 🌊 Sea Level Impact Calculation
-    sea_level_impact_mm = (co2_footprint_kg / 1000) * 0.00000008 * 1000  # Convert to micrometers
-    decade_impact=sea_level_impact_mm*10
+    # 🌊 Sea Level Impact (micrometers)
+    sea_level_impact_mm = impact["sea_level_um"]
+    decade_impact = impact["decade_sea_level_um"]
 
     # 🌊 Sea Level Impact Message
     sea_message = f"""
@@ -161,15 +169,14 @@ def calculate_and_display_impact(co2_footprint_kg):
 def compare_to_global_average(monthly_co2_kg):
     """Compares a user's monthly CO2 footprint to the global average and displays it with styled output."""
 
-    global_average_annual_kg = 4000  # 4 metric tons converted to kilograms
-    annual_co2_kg = monthly_co2_kg * 12
-    ratio = monthly_co2_kg / global_average_annual_kg
+    global_average_annual_kg = get_factors().global_average_annual_kg
+    ratio = impact_summary(monthly_co2_kg)["global_ratio"]
 
     if ratio > 1:
         message = f"""
         <div style="font-size:20px; text-align:left; padding:10px; line-height:1.6;">
 
-        🔥 Your emissions are <span style="color:#ff5733;"><b>{ratio:.2f} times</b> higher</span> than the global average of 4000 kg CO₂e per year.  
+        🔥 Your emissions are <span style="color:#ff5733;"><b>{ratio:.2f} times</b> higher</span> than the global average of {global_average_annual_kg:.0f} kg CO₂e per year.  
         <br>
         <b>🌡️ This means a higher impact on climate change, increased deforestation, and greater responsibility to reduce your footprint.</b>
         </div>
@@ -178,7 +185,7 @@ def compare_to_global_average(monthly_co2_kg):
         lower_ratio = 1 / ratio
         message = f"""
         <div style="font-size:20px; text-align:left; padding:10px; line-height:1.6;">
-        ✅ Your emissions are <span style="color:#28a745;"><b>{lower_ratio:.2f} times lower</b></span> than the global average of 4000 kg CO₂e per year.  
+        ✅ Your emissions are <span style="color:#28a745;"><b>{lower_ratio:.2f} times lower</b></span> than the global average of {global_average_annual_kg:.0f} kg CO₂e per year.  
         <br>
         <b>🌱 This is great! Keep maintaining a sustainable lifestyle and encourage others to do the same.</b>
         </div>
@@ -186,7 +193,7 @@ def compare_to_global_average(monthly_co2_kg):
     else:
         message = f"""
         <div style="font-size:20px; text-align:left; padding:10px; line-height:1.6;">
-        ⚖️ Your emissions match the global average of 4000 kg CO₂e per year.
+        ⚖️ Your emissions match the global average of {global_average_annual_kg:.0f} kg CO₂e per year.
         <br>
         <b>🔄 While you're at an average level, consider ways to reduce further for a greener future!</b>
         </div>
@@ -237,43 +244,45 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 genai.configure(api_key=GOOGLE_API_KEY)
 model1 = genai.GenerativeModel('gemini-2.0-flash')
 
-def generate_eco_suggestion(issue):
-    """Generate a personalized eco-friendly suggestion using Google Gemini."""
-    prompt = f"""
-    Generate a suggestion for someone who {issue}.
-    Format it as a problem statement followed by a specific actionable solution.
-    Make it detailed and conversational but not more than 3 bullets under each 'what you can do'.
-    Ensure no extra text is displayed before and after it.
-    Problem should be summarised in 2 sentences.
-    Each bullet should have 2-3 sentences for explanation.
-    What you can do should have a pointer followed by ':' followed by explanation.
-    Example format: "Problem: [brief issue]. What you can do: [specific action]"
-    """
-    
-    response = model1.generate_content(prompt)
-    return response.text.strip()
-# ✅ Conversion factor: 1 hectare absorbs 180,000 kg CO₂
-CO2_ABSORPTION_PER_HECTARE_KG = 180000  
-
-FORESTS = {
-    "Birik Forest, West Bengal, India": (26.979467, 88.428268),
-    "Berambadi State Forest, Karnataka, India": (11.768967, 76.479446)
-}
+@st.cache_resource
+def load_suggestion_engine():
+    """Shared across sessions: up to 4 parallel Gemini calls, answers cached on disk."""
+    # ECOX_OFFLINE=1 swaps Gemini for a local stub (no network, no API quota)
+    client = StubClient() if os.getenv("ECOX_OFFLINE") == "1" else model1
+    return SuggestionEngine(client, cache=default_cache(), max_workers=4)
 
-def co2_to_forest_area(co2_kg):
-    """Convert CO₂ footprint (kg) to lost forest area (m²)."""
-    return (co2_kg / CO2_ABSORPTION_PER_HECTARE_KG) * 10000  # Convert to m²
+@st.cache_resource
+def load_report_exporter():
+    """Shared across sessions: report PDF/DOCX bytes, memoized by report hash and format."""
+    return ReportExporter()
+
+@st.cache_resource
+def load_report_cache():
+    """Shared across sessions: generated reports on disk, keyed by normalized question and settings."""
+    return default_report_cache()
+
+@st.cache_resource
+def load_search_client():
+    """Shared across sessions: pooled Custom Search client with a disk cache and request coalescing."""
+    return default_search_client()
+@st.cache_resource
+def load_forest_registry():
+    """Shared across sessions: forests from data/forests.csv (ECOX_FORESTS_PATH), read on first lookup."""
+    return ForestRegistry(os.getenv("ECOX_FORESTS_PATH", DEFAULT_FORESTS_PATH))
 
-def generate_polygon(center_lat, center_lon, area_m2):
-    """Generate a square polygon to visualize lost forest area."""
-    side_length = (area_m2 ** 0.5) / 111320  # Convert meters to degrees
+FORESTS = load_forest_registry()
+# Forests offered when the user gives no location
+DEFAULT_FOREST_CHOICES = 2
+NEAREST_FOREST_CHOICES = 3
 
-    lat_min = center_lat - side_length / 2
-    lat_max = center_lat + side_length / 2
-    lon_min = center_lon - side_length / 2
-    lon_max = center_lon + side_length / 2
+@st.cache_resource
+def load_forest_maps():
+    """Shared across sessions: base map HTML per forest, rendered once."""
+    return ForestMapRenderer(FORESTS)
 
-    return [(lat_min, lon_min), (lat_min, lon_max), (lat_max, lon_max), (lat_max, lon_min), (lat_min, lon_min)]
+def co2_to_forest_area(co2_kg):
+    """Convert CO₂ footprint (kg) to lost forest area (m²)."""
+    return float(forest_area_m2(co2_kg))
 
 def visualize_forest_loss(prediction, forest_name):
     """Generate and display the map based on CO₂ footprint and chosen forest."""
@@ -283,35 +292,38 @@ def visualize_forest_loss(prediction, forest_name):
 
     latitude, longitude = FORESTS[forest_name]  
     lost_area_m2 = co2_to_forest_area(prediction)  # Convert CO₂ to area lost
-    polygon_coords = generate_polygon(latitude, longitude, lost_area_m2)
-
-    zoom_level = 30 
-
-    # Folium map
-    m = folium.Map(location=[latitude, longitude], zoom_start=zoom_level)
-
-    folium.Polygon(
-        locations=polygon_coords,
-        color="red",
-        fill=True,
-        fill_color="red",
-        fill_opacity=0.5,
-        popup=f"Forest Loss: {lost_area_m2:.2f} m²",
-    ).add_to(m)
-
-    folium_static(m)
+    polygon_coords = loss_polygon(latitude, longitude, lost_area_m2)  # Geodesically correct square
+
+    # Zoom that frames the polygon, within the tile servers' range
+    zoom_level = fit_zoom(lost_area_m2, latitude)
+    label = f"Forest Loss: {lost_area_m2:.2f} m²"
+
+    # 🗺️ Cached base map per forest; only the polygon changes per prediction
+    maps = load_forest_maps()
+    components.html(maps.inline_html(forest_name, polygon_coords, zoom_level, label), height=maps.height)
+
+@st.fragment
+def show_forest_maps(prediction, forest_choices):
+    """Map of the selected forest only; switching forests reruns just this fragment."""
+    distances = dict(forest_choices)
+    forest_name = st.radio("Forest", list(distances), horizontal=True, label_visibility="collapsed")
+    st.subheader(f"Impact on {forest_name}")
+    if distances[forest_name] is not None:
+        st.caption(f"📍 {distances[forest_name]:,.0f} km from you")
+    visualize_forest_loss(prediction, forest_name)
     
 # Function to load model and related components
+# The bundle (or legacy pickles) is only opened here; each part loads on first use
+BUNDLE_DIR = os.getenv("ECOX_BUNDLE_DIR", "carbon_bundle")
+
 @st.cache_resource
 def load_model():
-    try:
-        model = joblib.load("carbon_model.pkl")
-        encoders = joblib.load("encoders.pkl")
-        scaler = joblib.load("scaler.pkl")
-        return model, encoders, scaler
-    except FileNotFoundError:
+    artifacts = load_artifacts(BUNDLE_DIR, ".")
+    if not artifacts.available():
         st.error("Model files not found. Please make sure the trained model and preprocessing files exist.")
-        return None, None, None
+        return None
+    return artifacts
+
 sidebar_background = """
 <style>
 [data-testid="stSidebar"]::before {
@@ -560,9 +572,9 @@ elif page == "Calculate Footprint":
     st.title("🍂 Calculate Your Carbon Footprint")
     st.write("Fill in the details below to estimate your carbon emissions.")
     
-    model, encoders, scaler = load_model()
+    artifacts = load_model()
     
-    if model is not None and encoders is not None and scaler is not None:
+    if artifacts is not None:
         # Initialize session state for storing form values
         if 'weight' not in st.session_state:
             st.session_state.weight = 70.0
@@ -807,6 +819,15 @@ elif page == "Calculate Footprint":
             </style>
             """, unsafe_allow_html=True)
             
+            # 📍 Optional: show the forests closest to the user instead of the default ones
+            with st.expander("📍 Your location (optional)"):
+                use_location = st.checkbox("Show the forests nearest to me")
+                loc_col1, loc_col2 = st.columns(2)
+                with loc_col1:
+                    user_latitude = st.number_input("Latitude", min_value=-90.0, max_value=90.0, value=20.5937, format="%.4f")
+                with loc_col2:
+                    user_longitude = st.number_input("Longitude", min_value=-180.0, max_value=180.0, value=78.9629, format="%.4f")
+            
             submitted = st.form_submit_button("🔍 Calculate Carbon Footprint")
         
         # Process form submission
@@ -835,41 +856,16 @@ elif page == "Calculate Footprint":
                     "Cooking_With": str(cooking_with) if cooking_with else "[]"
                 }
                 
-                # Create DataFrame
-                input_df = pd.DataFrame([user_input])
-                
-                # Encode categorical features
-                categorical_cols = [
-                    "Body Type", "Sex", "Diet", "How Often Shower", "Heating Energy Source",
-                    "Transport", "Vehicle Type", "Social Activity", "Frequency of Traveling by Air",
-                    "Waste Bag Size", "Energy efficiency", "Recycling", "Cooking_With"
-                ]
-                
-                numerical_cols = [
-                    "Monthly Grocery Bill", "Vehicle Monthly Distance Km", "Waste Bag Weekly Count",
-                    "How Long TV PC Daily Hour", "How Many New Clothes Monthly", "How Long Internet Daily Hour"
-                ]
-                
-                # Apply encoders
-                for col in categorical_cols:
-                    if col in encoders:
-                        # Handle unseen categories
-                        try:
-                            input_df[col] = encoders[col].transform(input_df[col])
-                        except ValueError:
-                            # If category not seen during training, use a default value
-                            input_df[col] = 0
-                
-                # Apply scaler to numerical columns
-                input_df[numerical_cols] = scaler.transform(input_df[numerical_cols])
-                
-                # Make prediction
-                prediction = model.predict(input_df)[0]
-                
-                progress_bar = st.progress(0)
-                for i in range(100):
-                    time.sleep(0.01)
-                    progress_bar.progress(i + 1)
+                # Progress follows the real pipeline stages (encode, predict, impact, map, suggestions)
+                progress_bar = st.progress(0) if ANIMATIONS else None
+                timer = StageTimer(on_progress=progress_bar.progress if progress_bar else None)
+
+                # Encode, scale and predict through the shared batch engine
+                timer.start("encode")
+                features = artifacts.predictor.encode(pd.DataFrame([user_input]))
+                timer.start("predict")
+                prediction = float(artifacts.predictor.model.predict(features)[0])
+                timer.start("impact")
                 
                 st.markdown(f"""
                 <div style="background-color: #e6ffe6; border-radius: 10px; padding: 20px; margin: 20px 0; 
@@ -881,18 +877,18 @@ elif page == "Calculate Footprint":
                 # Evaluate the result
                 if prediction < 1500:
                     st.success("🌱 Your carbon footprint is below average. Great job!")
-                    lottie_success = load_lottieurl("https://assets9.lottiefiles.com/packages/lf20_touohxv0.json")
-                    if lottie_success:
+                    lottie_success = lottie_assets.get("success")
+                    if lottie_success and ANIMATIONS:
                         st_lottie(lottie_success, height=200)
                 elif prediction < 2500:
                     st.warning("⚠️ Your carbon footprint is about average. There's room for improvement!")
-                    lottie_average = load_lottieurl("https://assets1.lottiefiles.com/private_files/lf30_gcroxmjc.json")
-                    if lottie_average:
+                    lottie_average = lottie_assets.get("average")
+                    if lottie_average and ANIMATIONS:
                         st_lottie(lottie_average, height=200)
                 else:
                     st.error("🔥 Your carbon footprint is above average. Consider making changes!")
-                    lottie_high = load_lottieurl("https://assets6.lottiefiles.com/temp/lf20_dgjK9i.json")
-                    if lottie_high:
+                    lottie_high = lottie_assets.get("high")
+                    if lottie_high and ANIMATIONS:
                         st_lottie(lottie_high, height=200)
                 
                 # Visual gauge for carbon footprint
@@ -914,16 +910,16 @@ elif page == "Calculate Footprint":
                 calculate_and_display_impact(prediction)
                 compare_to_global_average(prediction)
                 
+                timer.start("map")
                 col1, col2 = st.columns([2, 1])  
 
                 with col1:
                  
-                    resource_tabs = st.tabs(list(FORESTS.keys()))
-
-                    for forest_name, tab in zip(FORESTS.keys(), resource_tabs):
-                        with tab:
-                            st.subheader(f"Impact on {forest_name}")
-                            visualize_forest_loss(prediction, forest_name)
+                    if use_location:
+                        forest_choices = FORESTS.nearest(user_latitude, user_longitude, k=NEAREST_FOREST_CHOICES)
+                    else:
+                        forest_choices = [(name, None) for name in FORESTS.names[:DEFAULT_FOREST_CHOICES]]
+                    show_forest_maps(prediction, forest_choices)
 
                 with col2:
                     
@@ -1007,20 +1003,6 @@ elif page == "Calculate Footprint":
                 if new_clothes > 10:
                     suggestion_triggers.append("purchases more than 10 new clothing items per year")
 
-                # Generate dynamic suggestions
-                with st.spinner("Generating personalized eco-friendly suggestions..."):
-                    suggestions = []
-                    for issue in suggestion_triggers:
-                        try:
-                            suggestion = generate_eco_suggestion(issue)
-                            suggestions.append(suggestion)
-                        except Exception as e:
-                            st.error(f"Error generating suggestion: {str(e)}")
-                            # Fallback to static suggestions if API fails
-                            if "gasoline" in issue:
-                                suggestions.append("Problem: Gas vehicles emit CO2. What you can do: Try carpooling or public transit twice a week.")
-                            elif "screen" in issue:
-                                suggestions.append("Problem: High screen time uses electricity. What you can do: Set device-free hours and use power-saving modes.")
                 st.markdown(f"""
                         <style>
                         .feature-box {{
@@ -1031,27 +1013,41 @@ elif page == "Calculate Footprint":
                         }}
                         </style>
                         """, unsafe_allow_html=True)
-                with col1:
-                    for i in range(0, len(suggestions), 2):
-                        
-                        st.markdown(f"""
-                        <div class="feature-box">
-                            <p>{suggestions[i]}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
 
-                with col2:
-                    for i in range(1, len(suggestions), 2):
-                        st.markdown(f"""
-                        <div class="feature-box">
-                            <p>{suggestions[i]}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                # One slot per trigger, alternating columns, filled as each suggestion finishes
+                slots = []
+                for i in range(len(suggestion_triggers)):
+                    with (col1 if i % 2 == 0 else col2):
+                        slots.append(st.empty())
+
+                # Generate dynamic suggestions
+                timer.start("suggestions")
+                suggestions_shown = 0
+                with st.spinner("Generating personalized eco-friendly suggestions..."):
+                    for i, issue, suggestion, error in load_suggestion_engine().stream(suggestion_triggers):
+                        if error is not None:
+                            st.error(f"Error generating suggestion: {str(error)}")
+                            # Fallback to static suggestions if API fails
+                            suggestion = fallback_suggestion(issue)
+                        if suggestion:
+                            slots[i].markdown(f"""
+                            <div class="feature-box">
+                                <p>{suggestion}</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                            suggestions_shown += 1
 
                 # If no suggestions were generated
-                if not suggestions:
+                if not suggestions_shown:
                     st.info("Great job! We don't have any specific suggestions for improvement based on your current habits.")
 
+                st.session_state.stage_timings = timer.finish()
+                if SHOW_TIMINGS:
+                    with st.expander("⏱️ Stage timings"):
+                        st.table(pd.DataFrame(
+                            {"Seconds": st.session_state.stage_timings}
+                        ).round(3))
+
 #ENHANCE AWARENESS
 elif page == "Enhance Your Awareness":
     st.title("📚 Read to Succeed")
@@ -1169,68 +1165,70 @@ elif page == "Enhance Your Awareness":
         </style>
         """, unsafe_allow_html=True)
 
+        @st.cache_resource
+        def get_article_store(csv_path):
+            # One store per process: the CSV is parsed once and re-read only when its mtime changes
+            return ArticleStore(csv_path)
+
         def load_data():
             """
             Loads environmental news data from the CSV file.
-            If the file doesn't exist, runs the scraping script to create it first.
+            If the file doesn't exist, starts the scraper in the background (one per host)
+            and shows its progress instead of blocking the session.
             
             Returns:
-                dict: A dictionary with category names as keys and dataframes as values.
+                ArticleStore: The cached, category-indexed article store (None if not available yet).
             """
-            categories = [cat for cat in category_labels.values()]
-            
-            output_csv = "cleaned_file.csv"
+            output_csv = str(NEWS_CSV)
+            scrape_job = news_scrape_job()
             
             # Check if the CSV exists
             if not os.path.exists(output_csv):
-                st.warning("Data file not found. Running the scraper to collect articles. This might take a while...")
-                
                 try:
-                    # Run the scraping script in the same directory
-                    with st.spinner("Scraping news data... This may take several minutes..."):
-                        result = subprocess.run([sys.executable, "new.py"], 
-                                              capture_output=True, 
-                                              text=True,
-                                              check=True)
-                        st.success("Scraping completed successfully!")
-                        st.info(result.stdout)
-                except subprocess.CalledProcessError as e:
-                    st.error(f"Error running the scraper: {e}")
-                    st.error(f"Error details: {e.stderr}")
-                    return {}
+                    scrape_job.start()
                 except Exception as e:
-                    st.error(f"Unexpected error: {str(e)}")
-                    return {}
-                    
-                if not os.path.exists(output_csv):
+                    st.error(f"Error starting the scraper: {str(e)}")
+                    return None
+                
+                status = scrape_job.status()
+                if status["state"] == "running":
+                    st.info("📰 Collecting the latest articles in the background. This may take several minutes, check back soon!")
+                    if status["progress"]:
+                        st.caption(f"Scraper progress: {status['progress']}")
+                elif status["state"] == "failed":
+                    st.error(f"Error running the scraper (exit code {status.get('returncode')}). Last output: {status['progress']}")
+                else:
                     st.error(f"Error: File {output_csv} still not found after running the scraper.")
-                    return {}
+                return None
+            
+            # Serve the existing (possibly stale) data while a refresh runs
+            if scrape_job.is_running():
+                st.caption(f"🔄 Refreshing articles in the background... {scrape_job.status()['progress']}")
             
             try:
-                df = pd.read_csv(output_csv)
-                
-                # Split data by category
-                category_data = {}
-                for cat in categories:
-                    category_data[cat] = df[df['category'].str.lower() == cat.lower()]
-                
-                return category_data
+                store = get_article_store(output_csv)
+                store.refresh_if_stale()
+                return store
             except Exception as e:
                 st.error(f"Error loading data: {str(e)}")
-                return {}
+                return None
         
         with st.spinner("Loading Environmental News... 🌍"):
-            category_data = load_data()
+            store = load_data()
+        
+        if st.sidebar.button("🔄 Refresh news in background"):
+            if news_scrape_job().start(["--incremental"], force=True):
+                st.sidebar.success("Refresh started! New articles will appear once it finishes.")
+            else:
+                st.sidebar.info("A refresh is already running.")
+        
+        # Define the number of articles per page and total pages
+        articles_per_page = 6
+        max_articles = 30  # Only the latest 30 articles are shown
         
         # Check if data exists for the selected category
-        if category in category_data and not category_data[category].empty:
-            df_category = category_data[category]
-            
-            # Define the number of articles per page and total pages
-            articles_per_page = 6
-            max_articles = 30  
-            df_category = df_category.head(max_articles)  # Select the latest 30 articles
-            total_pages = min((len(df_category) + articles_per_page - 1) // articles_per_page, 5)
+        if store is not None and store.count(category) > 0:
+            total_pages = min((store.count(category, limit=max_articles) + articles_per_page - 1) // articles_per_page, 5)
             
             if total_pages > 0:
                 page_number = st.radio(
@@ -1241,13 +1239,10 @@ elif page == "Enhance Your Awareness":
                     label_visibility="collapsed"  
                 )
                 
-                start_idx = (page_number - 1) * articles_per_page
-                end_idx = start_idx + articles_per_page
-                
-                page_data = df_category.iloc[start_idx:end_idx]
+                page_data = store.page(category, page_number, articles_per_page, limit=max_articles)
                 
                 cols = st.columns(2)  
-                for idx, row in page_data.iterrows():
+                for idx, row in enumerate(page_data.to_dict("records")):
                     col = cols[idx % 2]  
                     with col:
                         st.markdown(f'''
@@ -1268,34 +1263,12 @@ elif page == "Enhance Your Awareness":
         st.subheader(f"Articles & Blogs: {selected_category_label} {category_emoji}")
         
         # Function to search Google using the Custom Search API
-        @st.cache_data(ttl=3600)  # Cache results for 1 hour
         def search_google(query, num_results=10):
             try:
-                from googleapiclient.discovery import build
-                
-                API_KEY = os.getenv("GOOGLE_API_KEY")
-                CSE_ID = os.getenv("GOOGLE_CSE_ID")
-                
-                if API_KEY == "API_KEY_NOT_FOUND" or CSE_ID == "CSE_ID_NOT_FOUND":
+                results = load_search_client().search(query, num_results)
+                if results is None:
                     st.warning("Google Search API credentials not found. Please configure them in your Streamlit secrets.")
                     return []
-                
-                service = build("customsearch", "v1", developerKey=API_KEY)
-                results = []
-                
-                res = service.cse().list(
-                    q=query,
-                    cx=CSE_ID,
-                    num=num_results
-                ).execute()
-                
-                for item in res.get("items", []):
-                    results.append({
-                        "title": item.get("title"),
-                        "link": item.get("link"),
-                        "snippet": item.get("snippet")
-                    })
-                    
                 return results
                 
             except Exception as e:
@@ -1411,39 +1384,26 @@ else:
     # Google search function
     def perform_google_search(query, num_results=5):
         try:
-            api_key = os.environ.get("GOOGLE_SEARCH_API_KEY")
-            cse_id = os.environ.get("GOOGLE_CSE_ID")
-            
-            if not api_key or not cse_id:
-                return None
-                
-            url = f"https://www.googleapis.com/customsearch/v1"
-            params = {
-                "key": api_key,
-                "cx": cse_id,
-                "q": query,
-                "num": num_results
-            }
-            
-            response = requests.get(url, params=params)
-            results = response.json()
-            
-            search_results = []
-            if "items" in results:
-                for item in results["items"]:
-                    search_results.append({
-                        "title": item.get("title", ""),
-                        "link": item.get("link", ""),
-                        "snippet": item.get("snippet", "")
-                    })
-            
-            return search_results
+            return load_search_client().search(query, num_results)
         except Exception as e:
             st.error(f"Error in Google Search: {str(e)}")
             return None
 
-    def generate_report(question, tone, min_words, max_words, additional_instructions="", specific_sections="", use_search=False, include_tables=True):
+    def generate_report(question, tone, min_words, max_words, additional_instructions="", specific_sections="", use_search=False, include_tables=True, stream=True, use_cache=True):
         try:
+            offline = os.getenv("ECOX_OFFLINE") == "1"
+            cache = load_report_cache()
+            key = report_key("offline-fake" if offline else "gemini-2.0-flash", question, tone, min_words, max_words,
+                             additional_instructions, specific_sections, use_search, include_tables)
+            
+            # ♻️ Identical request already answered (in any session): no search, no API call
+            cached_report = cache.get(key) if use_cache else None
+            if cached_report is not None:
+                st.session_state.report_timings = {"cache hit rate": cache.stats()["hit_rate"]}
+                if SHOW_TIMINGS:
+                    st.caption(f"Served from the report cache (hit rate {cache.stats()['hit_rate']:.0%})")
+                return cached_report
+            
             search_results = None
             if use_search:
                 with st.spinner("Searching for relevant information..."):
@@ -1482,316 +1442,35 @@ else:
                 for i, result in enumerate(search_results, 1):
                     prompt += f"{i}. {result['title']} - {result['link']}\n   {result['snippet']}\n\n"
             
-            # Initialize Gemini model
-            model = genai.GenerativeModel('gemini-2.0-flash')
+            # Initialize Gemini model (ECOX_OFFLINE=1 streams a canned local report instead)
+            model = FakeStreamingClient() if offline else genai.GenerativeModel('gemini-2.0-flash')
             
-            with st.spinner("Generating your climate report..."):
-                response = model.generate_content(prompt)
-                report_content = response.text
-                
-                # Clean up markdown code block syntax if present
-                if report_content.startswith("```markdown") or report_content.startswith("```"):
-                    report_content = report_content.replace("```markdown", "", 1)
-                    report_content = report_content.replace("```", "", 1)
-                
-                if report_content.endswith("```"):
-                    report_content = report_content.rsplit("```", 1)[0]
-                
-                report_content = report_content.strip()
+            if stream:
+                # ✍️ Show the report while it is being written
+                live_report = st.empty()
+                streamer = ReportStreamer(model)
+                report_content = streamer.run(prompt, on_update=live_report.markdown)
+                live_report.empty()
+                st.session_state.report_timings = {"first token": streamer.ttft, "total": streamer.total}
+            else:
+                with st.spinner("Generating your climate report..."):
+                    started = time.perf_counter()
+                    response = model.generate_content(prompt)
+                    # Clean up markdown code block syntax if present
+                    report_content = clean_report(response.text)
+                    st.session_state.report_timings = {"total": time.perf_counter() - started}
+            
+            if SHOW_TIMINGS:
+                st.caption(" · ".join(f"{name}: {seconds:.2f}s" for name, seconds in st.session_state.report_timings.items() if seconds is not None))
             
+            if report_content:
+                cache.set(key, report_content)
             return report_content
         
         except Exception as e:
             st.error(f"Error generating report: {str(e)}")
             return None
 
-    def get_available_width(doc):
-        return doc.width - doc.leftMargin - doc.rightMargin
-
-    def create_pdf(content):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-        styles = getSampleStyleSheet()
-        
-        # Update all styles to include proper wrapping
-        for style_name in styles.byName:
-            styles[style_name].wordWrap = 'CJK'
-            styles[style_name].allowWidows = 0
-            styles[style_name].allowOrphans = 0
-        
-        try:
-            custom_heading1 = ParagraphStyle(
-                name='CustomHeading1', 
-                parent=styles['Heading1'],
-                fontSize=16, 
-                spaceAfter=12, 
-                textColor=colors.blue,
-                wordWrap='CJK'
-            )
-            custom_heading2 = ParagraphStyle(
-                name='CustomHeading2', 
-                parent=styles['Heading2'],
-                fontSize=14, 
-                spaceAfter=10, 
-                textColor=colors.navy,
-                wordWrap='CJK'
-            )
-            custom_heading3 = ParagraphStyle(
-                name='CustomHeading3', 
-                parent=styles['Heading3'],
-                fontSize=12, 
-                spaceAfter=8, 
-                textColor=colors.darkblue,
-                wordWrap='CJK'
-            )
-            carbon_section = ParagraphStyle(
-                name='CarbonSection', 
-                parent=styles['Normal'],
-                fontSize=12, 
-                spaceAfter=8, 
-                backColor=colors.lightgreen, 
-                borderColor=colors.green, 
-                borderWidth=1, 
-                borderPadding=5,
-                wordWrap='CJK'
-            )
-        except KeyError:
-            pass
-        
-        elements = []
-        
-        elements.append(Paragraph("Climate & Carbon Footprint Report", styles['Title']))
-        elements.append(Spacer(1, 12))
-        
-        lines = content.split('\n')
-        current_list = []
-        in_list = False
-        in_table = False
-        table_data = []
-        in_carbon_section = False
-        available_width = get_available_width(doc)
-        
-        for line in lines:
-            if "# Relation with Carbon Footprint" in line or "## Relation with Carbon Footprint" in line:
-                in_carbon_section = True
-                if in_list:
-                    elements.append(Table([[bullet] for bullet in current_list]))
-                    current_list = []
-                    in_list = False
-                try:
-                    elements.append(Paragraph(line.replace('#', '').strip(), custom_heading1))
-                except:
-                    elements.append(Paragraph(line.replace('#', '').strip(), styles['Heading1']))
-                elements.append(Spacer(1, 6))
-                continue
-            elif in_carbon_section and (line.startswith('# ') or line.startswith('## ')):
-                in_carbon_section = False
-            
-            # Headings
-            if line.startswith('# '):
-                if in_list:
-                    elements.append(Table([[bullet] for bullet in current_list]))
-                    current_list = []
-                    in_list = False
-                try:
-                    elements.append(Paragraph(line[2:], custom_heading1))
-                except:
-                    elements.append(Paragraph(line[2:], styles['Heading1']))
-            elif line.startswith('## '):
-                if in_list:
-                    elements.append(Table([[bullet] for bullet in current_list]))
-                    current_list = []
-                    in_list = False
-                try:
-                    elements.append(Paragraph(line[3:], custom_heading2))
-                except:
-                    elements.append(Paragraph(line[3:], styles['Heading2']))
-            elif line.startswith('### '):
-                if in_list:
-                    elements.append(Table([[bullet] for bullet in current_list]))
-                    current_list = []
-                    in_list = False
-                try:
-                    elements.append(Paragraph(line[4:], custom_heading3))
-                except:
-                    elements.append(Paragraph(line[4:], styles['Heading3']))
-            
-            # Lists
-            elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                in_list = True
-                current_list.append(line.strip()[2:])
-            
-            # Tables (simplified)
-            elif line.strip().startswith('|') and not in_table:
-                in_table = True
-                table_data = [line.strip().split('|')[1:-1]]
-            elif line.strip().startswith('|') and in_table:
-                if not line.strip().startswith('|-'):  # Skip separator row
-                    table_data.append(line.strip().split('|')[1:-1])
-            elif in_table:
-                # Table end
-                in_table = False
-                if table_data:
-                    col_widths = [available_width/len(table_data[0])]*len(table_data[0])
-                    table = Table(table_data, colWidths=col_widths)
-                    table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                        ('WORDWRAP', (0, 0), (-1, -1), True)
-                    ]))
-                    elements.append(table)
-                    elements.append(Spacer(1, 12))
-                
-                if line.strip():
-                    try:
-                        style = carbon_section if in_carbon_section else styles['Normal']
-                    except:
-                        style = styles['Normal']
-                    elements.append(Paragraph(line, style))
-            
-            # Regular paragraphs
-            elif line.strip() and not in_list and not in_table:
-                try:
-                    style = carbon_section if in_carbon_section else styles['Normal']
-                except:
-                    style = styles['Normal']
-                elements.append(Paragraph(line, style))
-                elements.append(Spacer(1, 6))
-        
-        if in_list:
-            elements.append(Table([[bullet] for bullet in current_list]))
-        
-        # Build the PDF
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer
-
-    def create_docx(content):
-        doc = Document()
-        
-        section = doc.sections[0]
-        section.left_margin = 914400 // 8 
-        section.right_margin = 914400 // 8
-        
-        doc.add_heading('Climate & Carbon Footprint Report', 0)
-        
-        lines = content.split('\n')
-        current_list = []
-        in_list = False
-        in_table = False
-        table_data = []
-        in_carbon_section = False
-        
-        for line in lines:
-            if "# Relation with Carbon Footprint" in line or "## Relation with Carbon Footprint" in line:
-                in_carbon_section = True
-                if in_list:
-                    paragraph = doc.add_paragraph()
-                    for item in current_list:
-                        paragraph.add_run('• ' + item + '\n')
-                    current_list = []
-                    in_list = False
-                heading = doc.add_heading(line.replace('#', '').strip(), 1)
-                continue
-            elif in_carbon_section and (line.startswith('# ') or line.startswith('## ')):
-                in_carbon_section = False
-            
-            # Headings
-            if line.startswith('# '):
-                if in_list:
-                    paragraph = doc.add_paragraph()
-                    for item in current_list:
-                        paragraph.add_run('• ' + item + '\n')
-                    current_list = []
-                    in_list = False
-                doc.add_heading(line[2:], 1)
-            elif line.startswith('## '):
-                if in_list:
-                    paragraph = doc.add_paragraph()
-                    for item in current_list:
-                        paragraph.add_run('• ' + item + '\n')
-                    current_list = []
-                    in_list = False
-                doc.add_heading(line[3:], 2)
-            elif line.startswith('### '):
-                if in_list:
-                    paragraph = doc.add_paragraph()
-                    for item in current_list:
-                        paragraph.add_run('• ' + item + '\n')
-                    current_list = []
-                    in_list = False
-                doc.add_heading(line[4:], 3)
-            
-            # Lists
-            elif line.strip().startswith('- ') or line.strip().startswith('* '):
-                in_list = True
-                current_list.append(line.strip()[2:])
-            
-            # Tables
-            elif line.strip().startswith('|') and not in_table:
-                in_table = True
-                table_data = [line.strip().split('|')[1:-1]]
-            elif line.strip().startswith('|') and in_table:
-                if not line.strip().startswith('|-'):  
-                    table_data.append(line.strip().split('|')[1:-1])
-            elif in_table and table_data:
-                # Table end
-                in_table = False
-                
-                # Create the table
-                if len(table_data) > 1:  
-                    table = doc.add_table(rows=len(table_data), cols=len(table_data[0]))
-                    table.style = 'Table Grid'
-                    
-                    for i, row_data in enumerate(table_data):
-                        for j, cell_data in enumerate(row_data):
-                            if j < len(table.rows[i].cells):  
-                                table.rows[i].cells[j].text = cell_data.strip()
-                    
-                    for cell in table.rows[0].cells:
-                        cell.paragraphs[0].runs[0].bold = True
-                    
-                    table_width = section.page_width - section.left_margin - section.right_margin
-                    for column in table.columns:
-                        column.width = int(table_width / len(table_data[0]))
-                    
-                    doc.add_paragraph() 
-                
-                if line.strip():
-                    para = doc.add_paragraph(line)
-                    if in_carbon_section:
-                        para.style = 'Quote'
-            
-            # Regular paragraphs
-            elif line.strip() and not in_list and not in_table:
-                para = doc.add_paragraph(line)
-                if in_carbon_section:
-                    para.style = 'Quote'
-        
-        if in_list:
-            paragraph = doc.add_paragraph()
-            for item in current_list:
-                paragraph.add_run('• ' + item + '\n')
-        
-        # Save to a BytesIO object
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-        return buffer
-
-    def create_download_link(buffer, filename, format_type):
-        buffer.seek(0)
-        b64 = base64.b64encode(buffer.read()).decode()
-        
-        mime_type = "application/pdf" if format_type == "PDF" else "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        href = f'<a href="data:{mime_type};base64,{b64}" download="{filename}" class="download-button">Download {format_type}</a>'
-        
-        return href
-
     # Main content area
     st.header("🌍 Generate Comprehensive Reports to Your Queries")
     st.markdown("Generate detailed climate and carbon footprint reports using Google's Gemini AI model")
@@ -1845,6 +1524,9 @@ else:
             placeholder="Example:\nCurrent Market Analysis\nRegulatory Framework\nFuture Outlook",
             height=100
         )
+        
+        stream_report = st.checkbox("Show the report while it is being written", value=True)
+        reuse_reports = st.checkbox("Reuse a saved report for an identical request", value=True)
 
     if st.button("Generate Report", type="primary"):
         if not st.session_state.question:
@@ -1860,7 +1542,9 @@ else:
                 additional_instructions=additional_instructions,
                 specific_sections=specific_sections,
                 use_search=use_search,
-                include_tables=include_tables
+                include_tables=include_tables,
+                stream=stream_report,
+                use_cache=reuse_reports
             )
             
             if report_content:
@@ -1902,19 +1586,22 @@ else:
         with download_tab:
             st.subheader("Download Options")
             
-            if format_choice == "PDF":
-                buffer = create_pdf(st.session_state.report_content)
-                filename = "climate_report.pdf"
-                st.markdown(
-                    create_download_link(buffer, filename, "PDF"),
-                    unsafe_allow_html=True
-                )
-                st.info("Click the link above to download your report as a PDF file.")
-            else:  
-                buffer = create_docx(st.session_state.report_content)
-                filename = "climate_report.docx"
-                st.markdown(
-                    create_download_link(buffer, filename, "DOCX"),
-                    unsafe_allow_html=True
+            # 📦 Exports are built only when asked for, then reused on every rerun
+            exporter = load_report_exporter()
+            report = st.session_state.report_content
+            data = exporter.get(report, format_choice)
+            if data is None and st.button(f"Prepare {format_choice}", key=f"prepare_{format_choice}"):
+                with st.spinner(f"Building your {format_choice}..."):
+                    data = exporter.build(report, format_choice)
+            
+            if data is not None:
+                st.download_button(
+                    f"Download {format_choice}",
+                    data=data,
+                    file_name=f"climate_report.{format_choice.lower()}",
+                    mime=MIME_TYPES[format_choice],
+                    on_click="ignore",
+                    type="primary",
                 )
-                st.info("Click the link above to download your report as a Word document.")
\ No newline at end of file
+                st.info("Click the button above to download your report as a PDF file." if format_choice == "PDF"
+                        else "Click the button above to download your report as a Word document.")
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Forest-loss polygons on the sphere, many at once.
+
+Vertices are placed with the spherical destination-point formula (a bearing
+and a distance from the center), so a 1 km² square stays 1 km² at any
+latitude. The old fixed ``/ 111320`` metres-per-degree shrank shapes east-west
+away from the equator. Every function takes arrays of centers and areas and
+returns all polygons in a single NumPy call.
+"""
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+
+SHAPES = ("square", "circle", "hexagon")
+
+
+def destination(lat, lon, bearing_deg, distance_m):
+    """Point reached from (lat, lon) after ``distance_m`` along ``bearing_deg`` (all broadcastable)."""
+    phi1, lam1 = np.radians(lat), np.radians(lon)
+    theta = np.radians(bearing_deg)
+    delta = np.asarray(distance_m, dtype=np.float64) / EARTH_RADIUS_M
+
+    sin_phi2 = np.sin(phi1) * np.cos(delta) + np.cos(phi1) * np.sin(delta) * np.cos(theta)
+    phi2 = np.arcsin(np.clip(sin_phi2, -1.0, 1.0))
+    lam2 = lam1 + np.arctan2(np.sin(theta) * np.sin(delta) * np.cos(phi1), np.cos(delta) - np.sin(phi1) * sin_phi2)
+    return np.degrees(phi2), (np.degrees(lam2) + 540.0) % 360.0 - 180.0
+
+
+def _shape_geometry(shape, area_m2, segments):
+    """(bearings in degrees, vertex distance in metres) for a shape of the given area."""
+    if shape == "square":
+        # SW, SE, NE, NW: the corner order generate_polygon used
+        return np.array([225.0, 135.0, 45.0, 315.0]), np.sqrt(area_m2) / np.sqrt(2.0)
+    if shape == "circle":
+        return np.linspace(0.0, 360.0, segments, endpoint=False), np.sqrt(area_m2 / np.pi)
+    if shape == "hexagon":
+        return np.arange(0.0, 360.0, 60.0), np.sqrt(2.0 * area_m2 / (3.0 * np.sqrt(3.0)))
+    raise ValueError(f"Unknown shape '{shape}', expected one of {SHAPES}")
+
+
+def loss_polygons(lats, lons, areas_m2, shape="square", segments=32):
+    """
+    Closed polygons covering ``areas_m2`` around each center.
+
+    Args:
+        lats, lons: Centers in degrees, scalars or arrays of shape (n,)
+        areas_m2: Area of each polygon in square metres, broadcast against the centers
+        shape (str): "square", "circle" or "hexagon"
+        segments (int): Vertices per circle
+
+    Returns:
+        ndarray: (n, vertices + 1, 2) of (latitude, longitude); the first vertex is repeated at the end
+    """
+    lats, lons, areas = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(lats, dtype=np.float64)),
+        np.atleast_1d(np.asarray(lons, dtype=np.float64)),
+        np.atleast_1d(np.clip(np.asarray(areas_m2, dtype=np.float64), 0.0, None)),
+    )
+    bearings, distances = _shape_geometry(shape, areas, segments)
+    vertex_lat, vertex_lon = destination(lats[:, None], lons[:, None], bearings[None, :], distances[:, None])
+    polygons = np.stack([vertex_lat, vertex_lon], axis=-1)
+    return np.concatenate([polygons, polygons[:, :1]], axis=1)
+
+
+def loss_polygon(lat, lon, area_m2, shape="square", segments=32):
+    """A single polygon as a list of (lat, lon) tuples, ready for folium/Leaflet."""
+    return [tuple(vertex) for vertex in loss_polygons(lat, lon, area_m2, shape, segments)[0].tolist()]
+
+
+def simplify(ring, tolerance_m):
+    """
+    Ramer-Douglas-Peucker simplification of one closed (lat, lon) ring.
+
+    Distances are measured in a local equirectangular projection, in metres.
+    Rings that would drop below a triangle are returned unchanged.
+    """
+    ring = np.asarray(ring, dtype=np.float64)
+    if tolerance_m <= 0 or len(ring) < 5:
+        return ring
+
+    lat0 = np.radians(ring[:, 0].mean())
+    xy = np.column_stack([np.radians(ring[:, 1]) * np.cos(lat0), np.radians(ring[:, 0])]) * EARTH_RADIUS_M
+
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(ring) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        segment = xy[end] - xy[start]
+        points = xy[start + 1:end] - xy[start]
+        length = np.hypot(segment[0], segment[1])
+        if length == 0:
+            distances = np.hypot(points[:, 0], points[:, 1])
+        else:
+            distances = np.abs(segment[0] * points[:, 1] - segment[1] * points[:, 0]) / length
+        i = int(np.argmax(distances))
+        if distances[i] > tolerance_m:
+            split = start + 1 + i
+            keep[split] = True
+            stack.extend([(start, split), (split, end)])
+
+    return ring[keep] if keep.sum() >= 4 else ring
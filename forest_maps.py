@@ -0,0 +1,90 @@
+"""Forest-loss maps: one cached base map per forest, the loss polygon added per prediction.
+
+The base Leaflet page of each forest is rendered with folium once per process.
+Per prediction only the polygon, zoom and label are injected into that cached
+page as JSON, which a small overlay script draws; the page is then shown with
+``components.html``. final.py renders only the forest the user selects, so
+maps nobody looks at are never built or sent.
+"""
+import json
+import math
+import threading
+
+import folium  # type: ignore
+from branca.element import MacroElement  # type: ignore
+from jinja2 import Template
+
+# Highest zoom level the OpenStreetMap tile servers provide
+MAX_TILE_ZOOM = 18
+MIN_ZOOM = 2
+
+_OVERLAY_PLACEHOLDER = "/*ECOX_OVERLAY*/null"
+
+_OVERLAY_JS = """
+(function() {
+    var overlay = %(placeholder)s;
+    if (overlay === null) { return; }
+    var map = %(map_name)s;
+    if (overlay.polygon.length) {
+        var layer = L.polygon(overlay.polygon, {color: "red", fill: true, fillColor: "red", fillOpacity: 0.5}).addTo(map);
+        if (overlay.label) {
+            var popup = document.createElement("span");
+            popup.textContent = overlay.label;
+            layer.bindPopup(popup);
+        }
+    }
+    if (overlay.zoom) { map.setZoom(overlay.zoom); }
+})();
+"""
+
+
+def clamp_zoom(zoom):
+    return max(MIN_ZOOM, min(MAX_TILE_ZOOM, int(zoom)))
+
+
+def fit_zoom(area_m2, latitude, map_width_px=700, fill=0.25):
+    """Zoom level at which a square of ``area_m2`` spans about ``fill`` of the map width."""
+    side_m = max(math.sqrt(max(area_m2, 0.0)), 1e-3)
+    meters_per_px_at_zoom0 = 156543.03392 * math.cos(math.radians(latitude))
+    return clamp_zoom(math.log2(meters_per_px_at_zoom0 * map_width_px * fill / side_m))
+
+
+class _Overlay(MacroElement):
+    """Overlay script as a child of the map, so it is emitted after ``var map_<id> = L.map(...)``."""
+
+    _template = Template("{% macro script(this, kwargs) %}{{ this.code }}{% endmacro %}")
+
+    def __init__(self, code):
+        super().__init__()
+        self._name = "EcoxOverlay"
+        self.code = code
+
+
+class ForestMapRenderer:
+    """
+    Args:
+        forests (dict): {forest name: (latitude, longitude)}
+        height (int): Map height in pixels
+    """
+
+    def __init__(self, forests, height=450):
+        self.forests = forests
+        self.height = height
+        self._base_html = {}
+        self._lock = threading.Lock()
+
+    def base_html(self, forest_name):
+        """Leaflet page for a forest with the overlay script but no polygon (cached)."""
+        with self._lock:
+            page = self._base_html.get(forest_name)
+            if page is None:
+                latitude, longitude = self.forests[forest_name]
+                m = folium.Map(location=[latitude, longitude], zoom_start=MAX_TILE_ZOOM, max_zoom=MAX_TILE_ZOOM)
+                m.add_child(_Overlay(_OVERLAY_JS % {"placeholder": _OVERLAY_PLACEHOLDER, "map_name": m.get_name()}))
+                page = self._base_html[forest_name] = m.get_root().render()
+            return page
+
+    def inline_html(self, forest_name, polygon, zoom, label=""):
+        """Full page with this prediction's polygon injected, for ``components.html``."""
+        overlay = json.dumps({"polygon": polygon, "zoom": clamp_zoom(zoom), "label": label}).replace("</", "<\\/")
+        return self.base_html(forest_name).replace(_OVERLAY_PLACEHOLDER, overlay, 1)
@@ -0,0 +1,162 @@
+"""Registry of forests loaded from ``data/forests.csv`` (or a GeoJSON file).
+
+Nothing is read until the registry is first used. The parsed centroids are
+cached next to the source as a ``.npy`` file and memory-mapped on later
+runs. Nearest-forest lookups use a k-d tree over unit vectors on the sphere,
+so each query is O(log n) even with thousands of forests. Without scipy the
+lookup falls back to a vectorized haversine scan.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_FORESTS_PATH = Path(__file__).resolve().parent / "data" / "forests.csv"
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _unit_vectors(lat, lon):
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _read_csv(path):
+    import csv
+
+    names, coords = [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            names.append(row["name"])
+            coords.append((float(row["latitude"]), float(row["longitude"])))
+    return names, coords
+
+
+def _read_geojson(path):
+    """Point features as-is; polygon features by the mean of their outer ring."""
+    with open(path, encoding="utf-8") as f:
+        collection = json.load(f)
+    names, coords = [], []
+    for i, feature in enumerate(collection.get("features", [])):
+        geometry = feature.get("geometry") or {}
+        kind, points = geometry.get("type"), geometry.get("coordinates")
+        if kind == "Point":
+            lon, lat = points[:2]
+        elif kind == "Polygon":
+            lon, lat = np.asarray(points[0], dtype=np.float64)[:, :2].mean(axis=0)
+        elif kind == "MultiPolygon":
+            lon, lat = np.concatenate([np.asarray(p[0], dtype=np.float64)[:, :2] for p in points]).mean(axis=0)
+        else:
+            continue
+        names.append((feature.get("properties") or {}).get("name") or f"Forest {i + 1}")
+        coords.append((float(lat), float(lon)))
+    return names, coords
+
+
+class ForestRegistry:
+    """
+    Args:
+        path (str): CSV with name, latitude, longitude columns, or a GeoJSON FeatureCollection
+    """
+
+    def __init__(self, path=DEFAULT_FORESTS_PATH):
+        self.path = Path(path)
+        self._names = None
+        self._index = None
+        self._coords = None
+        self._tree = None
+        self._lock = threading.Lock()
+
+    def _cache_paths(self):
+        return self.path.parent / (self.path.name + ".coords.npy"), self.path.parent / (self.path.name + ".names.json")
+
+    def _load(self):
+        with self._lock:
+            if self._names is not None:
+                return
+            coords_path, names_path = self._cache_paths()
+            source_mtime = os.path.getmtime(self.path)
+            if (coords_path.exists() and names_path.exists()
+                    and os.path.getmtime(coords_path) >= source_mtime and os.path.getmtime(names_path) >= source_mtime):
+                names = json.loads(names_path.read_text(encoding="utf-8"))
+            else:
+                reader = _read_geojson if self.path.suffix.lower() in (".geojson", ".json") else _read_csv
+                names, coords = reader(self.path)
+                coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+                saved = False
+                if names:
+                    try:
+                        np.save(coords_path, coords)
+                        names_path.write_text(json.dumps(names), encoding="utf-8")
+                        saved = True
+                    except OSError:
+                        pass
+                if not saved:
+                    # Empty registry or read-only deploy: keep the parsed arrays in memory
+                    self._coords = coords
+            if self._coords is None:
+                self._coords = np.load(coords_path, mmap_mode="r")
+            self._index = {name: i for i, name in enumerate(names)}
+            self._names = names
+
+    @property
+    def names(self):
+        self._load()
+        return self._names
+
+    @property
+    def coords(self):
+        """(n, 2) array of (latitude, longitude), memory-mapped when cached."""
+        self._load()
+        return self._coords
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        self._load()
+        return name in self._index
+
+    def __getitem__(self, name):
+        """(latitude, longitude) of a forest."""
+        self._load()
+        lat, lon = self._coords[self._index[name]]
+        return float(lat), float(lon)
+
+    def _spatial_index(self):
+        if self._tree is None:
+            try:
+                from scipy.spatial import cKDTree  # type: ignore
+            except ImportError:
+                return None
+            coords = self.coords
+            self._tree = cKDTree(_unit_vectors(coords[:, 0], coords[:, 1]))
+        return self._tree
+
+    def nearest(self, latitude, longitude, k=1):
+        """
+        The ``k`` forests closest to a location.
+
+        Returns:
+            list: [(forest name, distance in km), ...], closest first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+        tree = self._spatial_index()
+        if tree is not None:
+            _, idx = tree.query(_unit_vectors([latitude], [longitude])[0], k=k)
+            idx = np.atleast_1d(idx)
+        else:
+            distances = haversine_km(latitude, longitude, self.coords[:, 0], self.coords[:, 1])
+            idx = np.argsort(distances)[:k]
+        coords = self.coords[idx]
+        distances = haversine_km(latitude, longitude, coords[:, 0], coords[:, 1])
+        return [(self._names[i], float(d)) for i, d in zip(idx, distances)]
@@ -0,0 +1,52 @@
+"""Environmental impact metrics for monthly CO₂ footprints.
+
+Pure NumPy: every function takes a scalar or an array of footprints (kg CO₂e
+per month) and returns all metrics at once, so the results page and bulk
+scoring share the same math. The factors come from conversion_factors
+(data/conversion_factors.json). Rendering lives in final.py.
+"""
+import numpy as np
+
+from conversion_factors import get_factors
+
+IMPACT_COLUMNS = [
+    "annual_co2_kg", "peepal_trees", "mahogany_trees", "teak_trees",
+    "sea_level_um", "decade_sea_level_um", "global_ratio", "forest_area_m2",
+]
+
+
+def forest_area_m2(co2_kg, factors=None):
+    """Forest area (m²) lost for ``co2_kg``."""
+    return (factors or get_factors()).forest_area_m2(co2_kg)
+
+
+def compute_impacts(co2_kg, factors=None):
+    """
+    All impact metrics for one or many monthly footprints.
+
+    Args:
+        co2_kg: Monthly footprint(s) in kg CO₂e, scalar or array-like
+        factors (FactorSet): Conversion factors (default: get_factors())
+
+    Returns:
+        dict: {metric: ndarray} for every name in IMPACT_COLUMNS
+    """
+    factors = factors or get_factors()
+    co2 = np.asarray(co2_kg, dtype=np.float64)
+    sea_level_um = factors.sea_level_um(co2)
+    return {
+        "annual_co2_kg": co2 * 12,
+        # np.rint rounds half to even, like the built-in round() used before
+        "peepal_trees": factors.trees(co2, "peepal"),
+        "mahogany_trees": factors.trees(co2, "mahogany"),
+        "teak_trees": factors.trees(co2, "teak"),
+        "sea_level_um": sea_level_um,
+        "decade_sea_level_um": sea_level_um * 10,
+        "global_ratio": co2 / factors.global_average_annual_kg,
+        "forest_area_m2": factors.forest_area_m2(co2),
+    }
+
+
+def impact_summary(co2_kg, factors=None):
+    """compute_impacts for a single footprint, as plain Python numbers."""
+    return {name: values.item() for name, values in compute_impacts(float(co2_kg), factors).items()}
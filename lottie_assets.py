@@ -0,0 +1,112 @@
+"""Local copies of the result-page Lottie animations.
+
+The animations are bundled in ``assets/lottie/`` and served from memory, so
+the prediction screen never waits on (or needs) lottiefiles.com. A background
+refresh may download the lottiefiles.com versions into ``.ecox_cache/lottie/``;
+once there, they are preferred over the bundled files. Run
+``python lottie_assets.py`` to refresh by hand.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+LOTTIE_URLS = {
+    "success": "https://assets9.lottiefiles.com/packages/lf20_touohxv0.json",
+    "average": "https://assets1.lottiefiles.com/private_files/lf30_gcroxmjc.json",
+    "high": "https://assets6.lottiefiles.com/temp/lf20_dgjK9i.json",
+}
+
+BUNDLED_DIR = Path(__file__).resolve().parent / "assets" / "lottie"
+LOTTIE_DIR = Path(os.getenv("ECOX_LOTTIE_DIR", os.path.join(".ecox_cache", "lottie")))
+
+
+def _read_json(path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class LottieAssets:
+    """
+    Args:
+        directory (Path): Where refreshed downloads are kept
+        bundled_dir (Path): The animations shipped with the app
+        max_age (float): Seconds before a downloaded copy is refreshed again
+    """
+
+    def __init__(self, directory=LOTTIE_DIR, urls=LOTTIE_URLS, timeout=3.0, bundled_dir=BUNDLED_DIR,
+                 max_age=7 * 24 * 3600):
+        self.directory = Path(directory)
+        self.bundled_dir = Path(bundled_dir)
+        self.urls = urls
+        self.timeout = timeout
+        self.max_age = max_age
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return self.directory / f"{name}.json"
+
+    def get(self, name):
+        """Animation JSON from memory, a refreshed download or the bundled file (None if none exists)."""
+        with self._lock:
+            if name in self._memory:
+                return self._memory[name]
+        data = _read_json(self._path(name))
+        if data is None:
+            data = _read_json(self.bundled_dir / f"{name}.json")
+        if data is None:
+            return None
+        with self._lock:
+            self._memory[name] = data
+        return data
+
+    def fetch(self, name):
+        """Download one animation (strict timeout) and store it on disk and in memory."""
+        try:
+            r = requests.get(self.urls[name], timeout=self.timeout)
+            if r.status_code != 200:
+                return None
+            data = r.json()
+        except (requests.RequestException, ValueError) as e:
+            logging.warning(f"Could not fetch Lottie animation '{name}': {e}")
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path(name).with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self._path(name))
+        with self._lock:
+            self._memory[name] = data
+        return data
+
+    def _is_fresh(self, name):
+        try:
+            return time.time() - self._path(name).stat().st_mtime < self.max_age
+        except OSError:
+            return False
+
+    def prefetch(self):
+        """Refresh downloaded copies older than ``max_age``; the bundled files cover any failure."""
+        for name in self.urls:
+            if not self._is_fresh(name):
+                self.fetch(name)
+
+    def prefetch_in_background(self):
+        thread = threading.Thread(target=self.prefetch, name="lottie-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+
+if __name__ == "__main__":
+    assets = LottieAssets()
+    assets.prefetch()
+    for name in LOTTIE_URLS:
+        source = "downloaded" if assets._path(name).exists() else "bundled" if assets.get(name) is not None else "missing"
+        print(f"{name}: {source}")
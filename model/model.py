@@ -1,16 +1,33 @@
+import argparse
 import pandas as pd
 import numpy as np
 import joblib
 import logging
+import sys
+from pathlib import Path
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 from sklearn.ensemble import RandomForestRegressor
 from xgboost import XGBRegressor  # type: ignore
 from sklearn.metrics import mean_squared_error
 
+# The bundle writer lives next to the app (one folder up)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from artifact_bundle import write_bundle  # noqa: E402
+from tuning import ResumableSearch, TrialStore  # noqa: E402
+
 # I used logging for my ease of understanding
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Training mode: the original grid search, or a resumable successive-halving / randomized search
+parser = argparse.ArgumentParser(description="Train the carbon footprint model.")
+parser.add_argument("--search", choices=["grid", "halving", "random"], default="grid",
+                    help="grid: original GridSearchCV; halving/random: resumable search with a trial store")
+parser.add_argument("--trials", default="tuning_trials.sqlite", help="Trial store for halving/random searches")
+parser.add_argument("--candidates", type=int, default=27, help="Parameter settings sampled per model (halving/random)")
+parser.add_argument("--n-jobs", type=int, default=-1, help="Parallel fits (default: all cores)")
+args = parser.parse_args()
+
 logging.info("Loading dataset...")
 df = pd.read_csv("Carbon Emission.csv")
 
@@ -58,46 +75,76 @@ X = df.drop(columns=[target_col])
 y = df[target_col]  
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# Hyperparameter tuning for RandomForest
-rf_params = {
-    'n_estimators': [100, 200],
-    'max_depth': [None, 10, 20],
-    'min_samples_split': [2, 5],
-    'min_samples_leaf': [1, 2]
-}
-logging.info("Tuning Random Forest hyperparameters...")
-rf_params = {
-    'n_estimators': [50, 100],  
-    'max_depth': [10, 20],      
-    'min_samples_split': [2, 5],
-    'min_samples_leaf': [1, 2]
-}
-
-rf_grid = GridSearchCV(
-    RandomForestRegressor(random_state=42), 
-    rf_params, 
-    cv=2,  
-    scoring='neg_mean_squared_error',
-    n_jobs=-1,  
-    verbose=2   
-)
-rf_grid.fit(X_train, y_train)
-best_rf_model = rf_grid.best_estimator_
+if args.search == "grid":
+    # Hyperparameter tuning for RandomForest
+    logging.info("Tuning Random Forest hyperparameters...")
+    rf_params = {
+        'n_estimators': [50, 100],  
+        'max_depth': [10, 20],      
+        'min_samples_split': [2, 5],
+        'min_samples_leaf': [1, 2]
+    }
+
+    rf_grid = GridSearchCV(
+        RandomForestRegressor(random_state=42), 
+        rf_params, 
+        cv=2,  
+        scoring='neg_mean_squared_error',
+        n_jobs=args.n_jobs,  
+        verbose=2   
+    )
+    rf_grid.fit(X_train, y_train)
+    best_rf_model = rf_grid.best_estimator_
+
+    # Hyperparameter tuning for XGBoost
+    xg_params = {
+        'n_estimators': [100, 200],
+        'learning_rate': [0.05, 0.1],
+        'max_depth': [3, 6],
+        'subsample': [0.8, 1.0]
+    }
+    logging.info("Tuning XGBoost hyperparameters...")
+    # Parallel over the grid, one XGBoost thread per fit (no oversubscription)
+    xg_grid = GridSearchCV(XGBRegressor(random_state=42, n_jobs=1), xg_params, cv=3,
+                           scoring='neg_mean_squared_error', n_jobs=args.n_jobs)
+    xg_grid.fit(X_train, y_train)
+    best_xg_model = xg_grid.best_estimator_
+else:
+    # Wider search spaces, sampled; finished folds are reused from the trial store
+    rf_space = {
+        'n_estimators': [50, 100, 200, 300],
+        'max_depth': [None, 10, 20, 30],
+        'min_samples_split': [2, 5, 10],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': [1.0, 'sqrt', 0.5]
+    }
+    xg_space = {
+        'n_estimators': [100, 200, 400],
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_depth': [3, 4, 6, 8],
+        'subsample': [0.7, 0.8, 1.0],
+        'colsample_bytree': [0.7, 0.8, 1.0]
+    }
+    factor = 3 if args.search == "halving" else None
+    store = TrialStore(args.trials)
+    search_options = dict(store=store, n_candidates=args.candidates, cv=3, factor=factor,
+                          n_jobs=args.n_jobs, refit_params={'n_jobs': args.n_jobs}, random_state=42)
+
+    logging.info(f"Tuning Random Forest hyperparameters ({args.search} search)...")
+    rf_search = ResumableSearch(RandomForestRegressor(random_state=42, n_jobs=1), rf_space,
+                                name="random_forest", **search_options).fit(X_train, y_train)
+    best_rf_model = rf_search.best_estimator_
+
+    logging.info(f"Tuning XGBoost hyperparameters ({args.search} search)...")
+    xg_search = ResumableSearch(XGBRegressor(random_state=42, n_jobs=1), xg_space,
+                                name="xgboost", **search_options).fit(X_train, y_train)
+    best_xg_model = xg_search.best_estimator_
+    store.close()
+
 rf_pred = best_rf_model.predict(X_test)
 rf_rmse = np.sqrt(mean_squared_error(y_test, rf_pred))
 logging.info(f"Random Forest Best RMSE: {rf_rmse:.2f}")
 
-# Hyperparameter tuning for XGBoost
-xg_params = {
-    'n_estimators': [100, 200],
-    'learning_rate': [0.05, 0.1],
-    'max_depth': [3, 6],
-    'subsample': [0.8, 1.0]
-}
-logging.info("Tuning XGBoost hyperparameters...")
-xg_grid = GridSearchCV(XGBRegressor(random_state=42), xg_params, cv=3, scoring='neg_mean_squared_error')
-xg_grid.fit(X_train, y_train)
-best_xg_model = xg_grid.best_estimator_
 xg_pred = best_xg_model.predict(X_test)
 xg_rmse = np.sqrt(mean_squared_error(y_test, xg_pred))
 logging.info(f"XGBoost Best RMSE: {xg_rmse:.2f}")
@@ -105,14 +152,19 @@ logging.info(f"XGBoost Best RMSE: {xg_rmse:.2f}")
 # I Saved the best model for my app
 if xg_rmse < rf_rmse:
     logging.info("XGBoost performed better. Saving XGBoost model.")
-    joblib.dump(best_xg_model, "carbon_model.pkl")
+    best_model = best_xg_model
 else:
     logging.info("Random Forest performed better. Saving Random Forest model.")
-    joblib.dump(best_rf_model, "carbon_model.pkl")
+    best_model = best_rf_model
+joblib.dump(best_model, "carbon_model.pkl")
 
 # I also Saved encoders and scaler
 logging.info("Saving encoders and scaler...")
 joblib.dump(encoders, "encoders.pkl")
 joblib.dump(scaler, "scaler.pkl")
 
+# Versioned bundle (manifest + uncompressed model) that the app loads lazily
+logging.info("Writing artifact bundle...")
+write_bundle("carbon_bundle", best_model, encoders, scaler, feature_cols=list(X.columns))
+
 logging.info("Training and saving process completed successfully!")
@@ -0,0 +1,185 @@
+"""Resumable hyperparameter search for model.py.
+
+Successive halving over randomly sampled candidates: every round fits the
+surviving candidates on a larger sample of the training rows and keeps the
+best ``1 / factor`` of them. Every (candidate, fold, sample size) score is
+written to a SQLite trial store as soon as it finishes, so an interrupted or
+repeated run on the same data skips folds that are already done.
+
+Folds run in parallel with joblib (one process per core) while each model is
+fitted with ``n_jobs=1``, so cores are used without oversubscribing threads.
+The final refit uses all cores for a single model; the saved model is reset to
+``n_jobs=1`` so single-row predictions in the app stay on one thread.
+"""
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import KFold, ParameterSampler
+
+
+class TrialStore:
+    """SQLite table of finished fold scores, keyed by search, data, parameters, fold and sample size."""
+
+    def __init__(self, path="tuning_trials.sqlite"):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS folds (
+                search TEXT, data TEXT, params TEXT, fold INTEGER, n_samples INTEGER,
+                score REAL, seconds REAL, created REAL,
+                PRIMARY KEY (search, data, params, fold, n_samples)
+            )""")
+        self.conn.commit()
+
+    def load(self, search, data):
+        """{(params, fold, n_samples): score} for everything already finished."""
+        rows = self.conn.execute(
+            "SELECT params, fold, n_samples, score FROM folds WHERE search = ? AND data = ?", (search, data)
+        )
+        return {(params, fold, n_samples): score for params, fold, n_samples, score in rows}
+
+    def record(self, search, data, params, fold, n_samples, score, seconds):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO folds VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (search, data, params, fold, n_samples, score, seconds, time.time()),
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def data_fingerprint(X, y):
+    """Short hash of the training data, so a changed dataset never reuses old scores."""
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=False).values.tobytes())
+    digest.update(json.dumps(list(X.columns)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _params_key(params):
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _fit_fold(estimator, params, X, y, train_idx, test_idx):
+    started = time.perf_counter()
+    model = clone(estimator).set_params(**params)
+    model.fit(X[train_idx], y[train_idx])
+    score = -mean_squared_error(y[test_idx], model.predict(X[test_idx]))
+    return score, time.perf_counter() - started
+
+
+class ResumableSearch:
+    """
+    Args:
+        estimator: Base estimator, configured with ``n_jobs=1``
+        param_distributions (dict): {parameter: list of candidate values}
+        store (TrialStore): Where fold scores are persisted
+        name (str): Name of this search in the store, e.g. "xgboost"
+        n_candidates (int): Parameter settings sampled up front
+        cv (int): Folds per candidate and round
+        factor (int): Halving factor; None runs a plain randomized search on all rows
+        min_samples (int): Training rows in the first halving round (at least)
+        n_jobs (int): Parallel fold fits
+        refit_params (dict): Parameters used only while refitting, e.g. {"n_jobs": -1}; they are
+            reset to the base estimator's values afterwards, so a saved model predicts single-threaded
+        random_state (int): Seed for sampling, subsets and folds (keep it fixed to resume)
+
+    After ``fit``: ``best_params_``, ``best_score_`` (negative MSE, from the last round the
+    winner was cross-validated in), ``best_estimator_`` (refitted on all rows) and ``history_``
+    (one dict per round). Halving stops early once a single candidate is left.
+    """
+
+    def __init__(self, estimator, param_distributions, store, name, n_candidates=27, cv=3, factor=3,
+                 min_samples=1000, n_jobs=-1, refit_params=None, random_state=42):
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.store = store
+        self.name = name
+        self.n_candidates = n_candidates
+        self.cv = cv
+        self.factor = factor
+        self.min_samples = min_samples
+        self.n_jobs = n_jobs
+        self.refit_params = refit_params or {}
+        self.random_state = random_state
+
+    def _schedule(self, n_rows, n_candidates):
+        """Training rows used in each round."""
+        if not self.factor or self.factor <= 1 or n_candidates <= 1:
+            return [n_rows]
+        rounds = 1 + math.ceil(math.log(n_candidates) / math.log(self.factor))
+        smallest = min(n_rows, max(self.min_samples, n_rows // self.factor ** (rounds - 1)))
+        schedule = [min(n_rows, smallest * self.factor ** i) for i in range(rounds)]
+        schedule[-1] = n_rows
+        return schedule
+
+    def fit(self, X, y):
+        search = f"{self.name}:{hashlib.sha256(_params_key(self.estimator.get_params()).encode()).hexdigest()[:8]}"
+        data = data_fingerprint(X, y)
+        done = self.store.load(search, data)
+
+        candidates = list(ParameterSampler(self.param_distributions, self.n_candidates, random_state=self.random_state))
+        keys = [_params_key(params) for params in candidates]
+        order = np.random.RandomState(self.random_state).permutation(len(X))
+        X_values, y_values = X.to_numpy(), y.to_numpy()
+        self.history_ = []
+
+        schedule = self._schedule(len(X), len(candidates))
+        for round_index, n_samples in enumerate(schedule):
+            rows = order[:n_samples]
+            X_round, y_round = X_values[rows], y_values[rows]
+            splits = list(KFold(self.cv, shuffle=True, random_state=self.random_state).split(X_round))
+
+            todo = [(i, fold) for i in range(len(candidates)) for fold in range(self.cv)
+                    if (keys[i], fold, n_samples) not in done]
+            logging.info(f"[{self.name}] round {round_index + 1}/{len(schedule)}: {len(candidates)} candidates x "
+                         f"{self.cv} folds on {n_samples} rows ({len(todo)} fits to run, "
+                         f"{len(candidates) * self.cv - len(todo)} reused)")
+
+            started = time.perf_counter()
+            results = Parallel(n_jobs=self.n_jobs, return_as="generator")(
+                delayed(_fit_fold)(self.estimator, candidates[i], X_round, y_round, *splits[fold]) for i, fold in todo
+            )
+            for (i, fold), (score, seconds) in zip(todo, results):
+                self.store.record(search, data, keys[i], fold, n_samples, score, seconds)
+                done[(keys[i], fold, n_samples)] = score
+
+            means = np.array([np.mean([done[(keys[i], fold, n_samples)] for fold in range(self.cv)])
+                              for i in range(len(candidates))])
+            self.history_.append({"round": round_index + 1, "n_samples": n_samples, "candidates": len(candidates),
+                                  "fits": len(todo), "seconds": time.perf_counter() - started,
+                                  "best_rmse": float(np.sqrt(-means.max()))})
+
+            if round_index < len(schedule) - 1:
+                keep = np.argsort(-means, kind="stable")[:max(1, math.ceil(len(candidates) / self.factor))]
+                candidates = [candidates[i] for i in keep]
+                keys = [keys[i] for i in keep]
+                means = means[keep]
+                if len(candidates) == 1:
+                    # Nothing left to compare: the refit below trains the winner on all rows
+                    logging.info(f"[{self.name}] one candidate left, skipping {len(schedule) - round_index - 1} "
+                                 f"remaining round(s)")
+                    break
+
+        best = int(np.argmax(means))
+        self.best_params_ = candidates[best]
+        self.best_score_ = float(means[best])
+        logging.info(f"[{self.name}] best CV RMSE {np.sqrt(-self.best_score_):.2f} with {self.best_params_}")
+
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_, **self.refit_params)
+        self.best_estimator_.fit(X, y)
+        # refit_params apply to the refit only; the saved model keeps the base settings (e.g. n_jobs=1)
+        base_params = self.estimator.get_params()
+        self.best_estimator_.set_params(**{name: base_params[name] for name in self.refit_params})
+        return self
@@ -0,0 +1,71 @@
+"""In-memory article store for the "Enhance Your Awareness" page.
+
+The scraped CSV is read once per process and re-read only when its mtime
+changes. Rows are grouped by category up front, so paging is a slice lookup.
+When pyarrow is installed a Parquet copy is kept next to the CSV to make
+cold starts faster.
+"""
+import os
+import threading
+
+import pandas as pd
+
+
+class ArticleStore:
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self.parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._by_category = {}
+
+    def _read(self):
+        csv_mtime = os.path.getmtime(self.csv_path)
+        try:
+            if os.path.getmtime(self.parquet_path) >= csv_mtime:
+                return pd.read_parquet(self.parquet_path)
+        except (OSError, ImportError, ValueError):
+            pass
+
+        df = pd.read_csv(self.csv_path)
+        try:
+            df.to_parquet(self.parquet_path, index=False)
+        except (ImportError, ValueError, OSError):
+            pass  # pyarrow missing or folder read-only: keep serving from the CSV
+        return df
+
+    def refresh_if_stale(self):
+        """Reload when the CSV changed on disk. Returns True if a reload happened."""
+        mtime = os.path.getmtime(self.csv_path)
+        if mtime == self._mtime:
+            return False
+        with self._lock:
+            if mtime == self._mtime:
+                return False
+            df = self._read()
+            # Incremental scrapes re-emit a changed article under the same id; keep the newest copy
+            if "unique_id" in df.columns:
+                df = df.drop_duplicates("unique_id", keep="last")
+            keys = df["category"].astype(str).str.lower()
+            self._by_category = {
+                cat: group.reset_index(drop=True) for cat, group in df.groupby(keys, sort=False)
+            }
+            self._mtime = mtime
+        return True
+
+    def categories(self):
+        return list(self._by_category)
+
+    def count(self, category, limit=None):
+        n = len(self._by_category.get(category.lower(), ()))
+        return min(n, limit) if limit is not None else n
+
+    def page(self, category, page_number, per_page, limit=None):
+        """Rows for 1-based ``page_number`` of ``category`` (optionally capped at ``limit`` rows)."""
+        df = self._by_category.get(category.lower())
+        if df is None:
+            return pd.DataFrame()
+        end = page_number * per_page
+        if limit is not None:
+            end = min(end, limit)
+        return df.iloc[(page_number - 1) * per_page:end]
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+from encoding import EncodingTables, UNKNOWN_FIRST
+
+# Same column layout as "Carbon Emission.csv" (and model/model.py)
+CATEGORICAL_COLS = [
+    "Body Type", "Sex", "Diet", "How Often Shower", "Heating Energy Source",
+    "Transport", "Vehicle Type", "Social Activity", "Frequency of Traveling by Air",
+    "Waste Bag Size", "Energy efficiency", "Recycling", "Cooking_With"
+]
+
+NUMERICAL_COLS = [
+    "Monthly Grocery Bill", "Vehicle Monthly Distance Km", "Waste Bag Weekly Count",
+    "How Long TV PC Daily Hour", "How Many New Clothes Monthly", "How Long Internet Daily Hour"
+]
+
+# Column order the model was trained on (dataset order without the target)
+FEATURE_COLS = [
+    "Body Type", "Sex", "Diet", "How Often Shower", "Heating Energy Source",
+    "Transport", "Vehicle Type", "Social Activity", "Monthly Grocery Bill",
+    "Frequency of Traveling by Air", "Vehicle Monthly Distance Km", "Waste Bag Size",
+    "Waste Bag Weekly Count", "How Long TV PC Daily Hour", "How Many New Clothes Monthly",
+    "How Long Internet Daily Hour", "Energy efficiency", "Recycling", "Cooking_With"
+]
+
+DEFAULT_CHUNK_SIZE = 50000
+
+
+class BatchPredictor:
+    """Scores many survey rows at once with the trained model, encoders and scaler.
+
+    All lookup tables are built once here, so each chunk costs one vectorized
+    encode, one scaling pass and a single ``model.predict`` call.
+    """
+
+    def __init__(self, model, encoders, scaler, chunk_size=DEFAULT_CHUNK_SIZE, unknown=UNKNOWN_FIRST):
+        self.model = model
+        self.chunk_size = chunk_size
+        self.feature_cols = list(getattr(model, "feature_names_in_", FEATURE_COLS))
+
+        # Accept either prebuilt EncodingTables or the raw encoders.pkl dict
+        if isinstance(encoders, EncodingTables):
+            self.encoding = encoders
+        else:
+            self.encoding = EncodingTables.from_encoders(
+                {col: enc for col, enc in encoders.items() if col in CATEGORICAL_COLS}, unknown
+            )
+
+        # StandardScaler parameters, applied as plain NumPy arithmetic
+        self.scale_cols = list(getattr(scaler, "feature_names_in_", NUMERICAL_COLS))
+        n = len(self.scale_cols)
+        self.mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(n)
+        self.scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n)
+
+    def encode(self, df):
+        """Turn a raw DataFrame chunk into the model's feature frame."""
+        columns = self.encoding.transform(df)
+        # Categorical columns without an encoder pass through unchanged
+        for col in CATEGORICAL_COLS:
+            if col not in columns:
+                columns[col] = df[col].fillna("None").astype(str).to_numpy() if col in df else np.full(len(df), "None")
+
+        numeric = np.empty((len(df), len(self.scale_cols)), dtype=np.float64)
+        for j, col in enumerate(self.scale_cols):
+            numeric[:, j] = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64) if col in df else np.nan
+        # Missing numbers land on the training mean (0 after scaling)
+        numeric = np.where(np.isnan(numeric), self.mean, numeric)
+        numeric = (numeric - self.mean) / self.scale
+        for j, col in enumerate(self.scale_cols):
+            columns[col] = numeric[:, j]
+
+        return pd.DataFrame({col: columns[col] for col in self.feature_cols}, index=df.index)
+
+    def predict_batch(self, records):
+        """Predict monthly CO₂e (kg) for a list of dicts or a DataFrame of survey rows.
+
+        Returns:
+            np.ndarray: One prediction per input row, in input order.
+        """
+        df = records if isinstance(records, pd.DataFrame) else pd.DataFrame.from_records(records)
+        if df.empty:
+            return np.empty(0, dtype=np.float64)
+
+        predictions = np.empty(len(df), dtype=np.float64)
+        for start in range(0, len(df), self.chunk_size):
+            chunk = df.iloc[start:start + self.chunk_size]
+            predictions[start:start + len(chunk)] = self.model.predict(self.encode(chunk))
+        return predictions
+
+
+def predict_batch(records, model, encoders, scaler, chunk_size=DEFAULT_CHUNK_SIZE):
+    """One-off helper: build a BatchPredictor and score ``records``."""
+    return BatchPredictor(model, encoders, scaler, chunk_size=chunk_size).predict_batch(records)
@@ -0,0 +1,138 @@
+"""
+Pluggable HTML parsing for The Hindu article pages.
+
+Backends, fastest first: selectolax, lxml, then BeautifulSoup's html.parser
+(always available). Every backend returns the same dict as parse_article().
+"""
+from bs4 import BeautifulSoup
+
+CONTENT_CLASSES = ["articlebodycontent", "col-xl-9 col-lg-12 col-md-12 col-sm-12 col-12"]
+
+
+def _result(title, subtitle, author, paragraphs):
+    # Defaults only for missing elements; an empty element stays "" as in the legacy parser
+    title = "No Title" if title is None else title
+    subtitle = "No Subtitle" if subtitle is None else subtitle
+    author = "Miscellaneous" if author is None else author
+    content = " ".join(paragraphs)
+    return {
+        'title': title,
+        'subtitle': subtitle,
+        'author': author,
+        'content': f"{title} {subtitle} {content}",
+    }
+
+
+def parse_bs4(html):
+    """Single pass over the tree with html.parser, stopping once everything is found."""
+    soup = BeautifulSoup(html, "html.parser")
+    title = subtitle = author = None
+    content_div = None
+
+    for tag in soup.descendants:
+        if tag.name not in ("h1", "h2", "a", "div"):
+            continue
+        classes = tag.get("class") or []
+        if tag.name == "h1" and title is None and "title" in classes:
+            title = tag.text.strip()
+        elif tag.name == "h2" and subtitle is None and "sub-title" in classes:
+            subtitle = tag.text.strip()
+        elif tag.name == "a" and author is None and " ".join(classes) == "person-name lnk":
+            author = tag.text.strip()
+        elif tag.name == "div" and content_div is None and (
+                " ".join(classes) in CONTENT_CLASSES or any(c in CONTENT_CLASSES for c in classes)):
+            content_div = tag
+        if title is not None and subtitle is not None and author is not None and content_div is not None:
+            break
+
+    paragraphs = [p.text.strip() for p in content_div.find_all("p", limit=2)] if content_div else []
+    return _result(title, subtitle, author, paragraphs)
+
+
+def parse_lxml(html):
+    import lxml.html  # type: ignore
+
+    tree = lxml.html.fromstring(html)
+
+    def first_text(xpath):
+        nodes = tree.xpath(xpath)
+        return nodes[0].text_content().strip() if nodes else None
+
+    has_class = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+    content = tree.xpath(
+        f"(//div[{has_class.format('articlebodycontent')} or @class='{CONTENT_CLASSES[1]}'])[1]"
+    )
+    paragraphs = [p.text_content().strip() for p in content[0].xpath(".//p")[:2]] if content else []
+    return _result(
+        first_text(f"//h1[{has_class.format('title')}]"),
+        first_text(f"//h2[{has_class.format('sub-title')}]"),
+        first_text("//a[@class='person-name lnk']"),
+        paragraphs,
+    )
+
+
+def parse_selectolax(html):
+    # The Lexbor engine; the older Modest ``selectolax.parser`` is gone in selectolax 1.0
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+
+    tree = LexborHTMLParser(html)
+
+    def first_text(selector):
+        node = tree.css_first(selector)
+        return node.text(deep=True).strip() if node else None
+
+    content = tree.css_first("div.articlebodycontent, div.col-xl-9.col-lg-12.col-md-12.col-sm-12.col-12")
+    paragraphs = [p.text(deep=True).strip() for p in content.css("p")[:2]] if content else []
+    return _result(
+        first_text("h1.title"),
+        first_text("h2.sub-title"),
+        first_text("a.person-name.lnk"),
+        paragraphs,
+    )
+
+
+BACKENDS = {
+    "selectolax": parse_selectolax,
+    "lxml": parse_lxml,
+    "bs4": parse_bs4,
+}
+
+
+def available_backends():
+    """Names of the backends whose libraries are installed, fastest first."""
+    available = []
+    for name in BACKENDS:
+        try:
+            if name == "selectolax":
+                import selectolax.lexbor  # type: ignore  # noqa: F401
+            elif name == "lxml":
+                import lxml.html  # type: ignore  # noqa: F401
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def get_parser(backend="auto"):
+    """Parser function for ``backend``, or the fastest installed one for "auto"."""
+    if backend == "auto":
+        backend = available_backends()[0]
+    return BACKENDS[backend]
+
+
+_default_parser = None
+
+
+def parse_article(html, backend="auto"):
+    """
+    Extract title, subtitle, author and the first two paragraphs from an article page.
+
+    Returns:
+        dict: title, subtitle, author and combined content
+    """
+    global _default_parser
+    if backend != "auto":
+        return BACKENDS[backend](html)
+    if _default_parser is None:
+        _default_parser = get_parser()
+    return _default_parser(html)
@@ -0,0 +1,91 @@
+import csv
+import json
+import os
+import time
+
+FIELDS = ['title', 'subtitle', 'author', 'content', 'link', 'category', 'unique_id']
+
+
+class ArticleSink:
+    """
+    Append-only JSONL store for scraped articles, checkpointed per category.
+
+    Each article is written and flushed as soon as it is parsed, so memory
+    stays flat and a crash loses at most the category in progress. The
+    checkpoint remembers which categories are finished (and where the file
+    ended at that point) so an interrupted run can resume.
+
+    Args:
+        jsonl_path (str): Staging file the articles are appended to
+    """
+
+    def __init__(self, jsonl_path):
+        self.jsonl_path = jsonl_path
+        self.checkpoint_path = jsonl_path + ".checkpoint.json"
+        self.checkpoint = self._load_checkpoint()
+
+        # Drop any rows of a category that was interrupted mid-way
+        if os.path.exists(self.jsonl_path):
+            with open(self.jsonl_path, "r+b") as f:
+                f.truncate(self.checkpoint["offset"])
+        self._file = open(self.jsonl_path, "a", encoding="utf-8")
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            print(f"Resuming run: {len(checkpoint['completed'])} categories already done")
+            return checkpoint
+        except (OSError, ValueError):
+            return {"started": time.time(), "completed": [], "offset": 0, "count": 0}
+
+    def _save_checkpoint(self):
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    @property
+    def started(self):
+        """When this (possibly resumed) run first started."""
+        return self.checkpoint["started"]
+
+    def is_done(self, category):
+        return category in self.checkpoint["completed"]
+
+    def write(self, article):
+        self._file.write(json.dumps(article, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def mark_done(self, category, count):
+        """Checkpoint a finished category together with its article count."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.checkpoint["completed"].append(category)
+        self.checkpoint["offset"] = os.path.getsize(self.jsonl_path)
+        self.checkpoint["count"] += count
+        self._save_checkpoint()
+
+    @property
+    def count(self):
+        return self.checkpoint["count"]
+
+    def export_csv(self, output_csv, append=False):
+        """Stream the staged articles into ``output_csv`` row by row, then clear the staging files."""
+        self._file.close()
+        write_header = not (append and os.path.exists(output_csv))
+        with open(self.jsonl_path, encoding="utf-8") as src, \
+                open(output_csv, "a" if append else "w", newline="", encoding="utf-8") as dst:
+            writer = csv.DictWriter(dst, fieldnames=FIELDS, lineterminator="\n")
+            if write_header:
+                writer.writeheader()
+            for line in src:
+                writer.writerow(json.loads(line))
+        self.discard()
+
+    def discard(self):
+        """Remove the staging file and checkpoint (the run is finished)."""
+        self._file.close()
+        for path in (self.jsonl_path, self.checkpoint_path):
+            if os.path.exists(path):
+                os.remove(path)
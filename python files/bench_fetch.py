@@ -0,0 +1,74 @@
+"""
+Benchmark the article fetch stage against a local HTTP fixture server.
+
+Serves a fake article page with artificial latency, then compares the old
+sequential loop (requests.get + 1 s sleep per article) with ArticleFetcher.
+
+Usage:
+    python bench_fetch.py --articles 30 --latency 0.2 --workers 8
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from fetcher import ArticleFetcher
+
+FIXTURE_HTML = b"""<html><body>
+<h1 class="title">Fixture article</h1>
+<h2 class="sub-title">A local page for benchmarking</h2>
+<a class="person-name lnk">Bench Author</a>
+<div class="articlebodycontent"><p>First paragraph.</p><p>Second paragraph.</p><p>Third.</p></div>
+</body></html>"""
+
+
+def start_fixture_server(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(FIXTURE_HTML)))
+            self.end_headers()
+            self.wfile.write(FIXTURE_HTML)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.2, help="Server delay per request (s)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=20.0, help="Requests per second per host")
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    server = start_fixture_server(args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/article/{i}" for i in range(args.articles)]
+
+    if not args.skip_sequential:
+        start = time.perf_counter()
+        for url in urls:
+            requests.get(url)
+            time.sleep(1)
+        print(f"Sequential (old loop): {time.perf_counter() - start:.2f}s")
+
+    fetcher = ArticleFetcher(max_workers=args.workers, rate_per_host=args.rate)
+    start = time.perf_counter()
+    ok = sum(1 for _, response, error in fetcher.fetch_all(urls) if error is None)
+    print(f"Concurrent ({args.workers} workers, {args.rate}/s): {time.perf_counter() - start:.2f}s, {ok}/{len(urls)} ok")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
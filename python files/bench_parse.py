@@ -0,0 +1,80 @@
+"""
+Benchmark article parsing per backend over a corpus of saved article pages.
+
+Compares the old BeautifulSoup extraction (a separate find() per field, each
+done twice) with every installed article_parser backend, and checks that the
+backends agree with it on every page.
+
+Usage:
+    python bench_parse.py corpus_dir --repeat 3
+"""
+import argparse
+import glob
+import os
+import statistics
+import time
+
+from bs4 import BeautifulSoup
+
+from article_parser import BACKENDS, available_backends
+
+
+def legacy_parse_article(html):
+    """The original multi-pass html.parser extraction, kept as the baseline."""
+    article_soup = BeautifulSoup(html, "html.parser")
+    title = article_soup.find("h1", class_="title").text.strip() if article_soup.find("h1", class_="title") else "No Title"
+    subtitle = article_soup.find("h2", class_="sub-title").text.strip() if article_soup.find("h2", class_="sub-title") else "No Subtitle"
+    author = article_soup.find("a", class_="person-name lnk").text.strip() if article_soup.find("a", class_="person-name lnk") else "Miscellaneous"
+    content = ""
+    content_div = article_soup.find("div", class_=["articlebodycontent", "col-xl-9 col-lg-12 col-md-12 col-sm-12 col-12"])
+    if content_div:
+        paragraphs = content_div.find_all("p", limit=2)
+        content = " ".join([p.text.strip() for p in paragraphs])
+    return {
+        'title': title,
+        'subtitle': subtitle,
+        'author': author,
+        'content': f"{title} {subtitle} {content}",
+    }
+
+
+def time_parser(parse, pages, repeat):
+    """Per-article parse times in milliseconds (best of ``repeat`` per page)."""
+    times = []
+    for html in pages:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse(html)
+            best = min(best, time.perf_counter() - start)
+        times.append(best * 1000)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus_dir", help="Directory of saved article .html files")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(args.corpus_dir, "*.html"))):
+        with open(path, "rb") as f:
+            pages.append(f.read())
+    if not pages:
+        raise SystemExit(f"No .html files found in '{args.corpus_dir}'")
+    print(f"{len(pages)} pages, {sum(map(len, pages)) / len(pages) / 1024:.0f} KiB on average")
+
+    expected = [legacy_parse_article(html) for html in pages]
+    parsers = {"legacy": legacy_parse_article, **{name: BACKENDS[name] for name in available_backends()}}
+
+    for name, parse in parsers.items():
+        times = time_parser(parse, pages, args.repeat)
+        mismatches = sum(1 for html, want in zip(pages, expected) if parse(html) != want)
+        print(f"{name:>10}: median {statistics.median(times):7.2f} ms, "
+              f"p95 {sorted(times)[int(len(times) * 0.95)]:7.2f} ms, "
+              f"total {sum(times) / 1000:6.2f} s, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
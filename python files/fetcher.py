@@ -0,0 +1,94 @@
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; EcoX news collector)"}
+
+
+def make_session(pool_size=16, retries=3, backoff=0.5):
+    """
+    Create a requests Session with a shared connection pool and retry/backoff.
+
+    Args:
+        pool_size (int): Max pooled connections per host
+        retries (int): Retries on connection errors and 429/5xx responses
+        backoff (float): Exponential backoff factor between retries (seconds)
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class HostRateLimiter:
+    """Spaces out requests to the same host to at most ``rate`` per second."""
+
+    def __init__(self, rate=4.0):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ArticleFetcher:
+    """
+    Fetch many article pages concurrently over one pooled session.
+
+    Args:
+        max_workers (int): Number of download threads
+        rate_per_host (float): Max requests per second to any single host
+        timeout (tuple): (connect, read) timeout in seconds
+    """
+
+    def __init__(self, session=None, max_workers=8, rate_per_host=4.0, timeout=(5, 20)):
+        self.session = session or make_session(pool_size=max_workers)
+        self.max_workers = max_workers
+        self.limiter = HostRateLimiter(rate_per_host)
+        self.timeout = timeout
+
+    def fetch(self, url, headers=None):
+        self.limiter.wait(url)
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def _fetch_safe(self, url, headers=None):
+        try:
+            response = self.fetch(url, headers=headers)
+            response.raise_for_status()
+            return url, response, None
+        except Exception as e:
+            return url, None, e
+
+    def fetch_all(self, urls, headers=None):
+        """
+        Yield ``(url, response, error)`` for every url, in input order.
+        
+        ``headers`` optionally maps a url to extra request headers (e.g. conditional GET
+        validators); a 304 Not Modified comes back as a normal response.
+        """
+        headers = headers or {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            yield from pool.map(self._fetch_safe, urls, [headers.get(url) for url in urls])
@@ -1,184 +1,164 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import urllib.parse
+import argparse
+import os
+from article_parser import parse_article
+from article_sink import ArticleSink
+from fetcher import ArticleFetcher
+from search_pages import collect_search_pages, extract_article_links
+from seen_index import SeenIndex
 
-def scrape_multiple_categories(categories, output_csv, pages_per_category=10):
+def scrape_multiple_categories(categories, output_csv, pages_per_category=10, max_workers=8, rate_per_host=4.0,
+                               incremental=False, revalidate=False, browsers=3, snapshot_dir=None, use_snapshots=False):
     """
     Scrape articles from The Hindu for multiple categories and combine them into a single CSV file.
     
+    Articles are streamed to an append-only JSONL file as they are parsed and checkpointed
+    per category, so an interrupted run resumes where it stopped. The CSV is written at the end.
+    
     Args:
         categories (list): List of category search terms
         output_csv (str): Path to the output CSV file
         pages_per_category (int): Number of pages to scrape per category
+        max_workers (int): Number of concurrent article downloads
+        rate_per_host (float): Max article requests per second to thehindu.com
+        incremental (bool): Only download articles not seen before and append them to output_csv
+        revalidate (bool): In incremental mode, also re-check seen articles with conditional GETs
+        browsers (int): Number of headless browsers rendering search pages in parallel
+        snapshot_dir (str): Folder to save rendered search pages to (and read them from)
+        use_snapshots (bool): Reuse saved search page snapshots instead of launching a browser
     
     Returns:
-        DataFrame: Combined dataset of all scraped articles
+        int: Number of articles written to output_csv
     """
-    # Initialize a list to store all DataFrames
-    all_dfs = []
+    # Append-only staging file, checkpointed per category (resumes after a crash)
+    sink = ArticleSink(os.path.splitext(output_csv)[0] + ".jsonl")
+    todo = [category for category in categories if not sink.is_done(category)]
+    
+    # Render all search result pages up front with a pool of headless browsers
+    # (or reuse saved snapshots), waiting for DOM readiness instead of fixed sleeps
+    search_pages = collect_search_pages(todo, pages_per_category, workers=browsers,
+                                        snapshot_dir=snapshot_dir, use_snapshots=use_snapshots)
     
-    # Set up Selenium to handle JavaScript-loaded content
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run Chrome in headless mode
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
+    # Pooled, rate-limited HTTP client for the article pages
+    fetcher = ArticleFetcher(max_workers=max_workers, rate_per_host=rate_per_host)
     
-    # Initialize the driver
-    driver = webdriver.Chrome(options=chrome_options)
+    # Persistent (category, url) -> unique_id index, so ids stay stable across runs
+    index_path = os.path.splitext(output_csv)[0] + "_index.sqlite"
+    index = SeenIndex(index_path, bootstrap_csv=output_csv if incremental else None)
     
     try:
         # Process each category
-        for category in categories:
+        for category in todo:
             print(f"\n{'='*50}")
             print(f"STARTING CATEGORY: {category}")
             print(f"{'='*50}\n")
             
-            # URL encode the category for the search
-            encoded_category = urllib.parse.quote(category)
-            
-            # Initialize lists to store data for this category
-            titles, subtitles, authors, contents, article_urls = [], [], [], [], []
+            category_count = 0
             
             # Loop through pages for this category
             for page_number in range(1, pages_per_category + 1):
-                print(f"Scraping {category} - Page {page_number}...")
-                
-                # Construct the URL for the search results page
-                search_url = f"https://www.thehindu.com/search/#gsc.tab=0&gsc.q={encoded_category}&gsc.sort=&gsc.page={page_number}"
-                
                 try:
-                    # Load the page with Selenium
-                    driver.get(search_url)
-                    
-                    # Wait for the search results to load
-                    WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "gsc-expansionArea"))
-                    )
-                    
-                    # Add a short delay to ensure all results are loaded
-                    time.sleep(5)
-                    
-                    # Get the page source after JavaScript has run
-                    page_source = driver.page_source
-                    soup = BeautifulSoup(page_source, "html.parser")
-                    
-                    # Find the expansion area that contains all results
-                    expansion_area = soup.find("div", class_="gsc-expansionArea")
+                    page_source = search_pages.get((category, page_number))
+                    if page_source is None:
+                        continue
                     
-                    if not expansion_area:
+                    article_links = extract_article_links(page_source)
+                    if article_links is None:
                         print("Could not find expansion area. Page structure might have changed.")
                         continue
                     
-                    # Find all result items
-                    result_items = expansion_area.find_all("div", class_="gsc-webResult gsc-result")
-                    print(f"Found {len(result_items)} result items on page {page_number}")
-                    
-                    article_links = []
-                    
-                    for item in result_items:
-                        # Navigate through the nested structure
-                        gs_web_result = item.find("div", class_="gs-webResult gs-result")
-                        if gs_web_result:
-                            thumbnail_inside = gs_web_result.find("div", class_="gsc-thumbnail-inside")
-                            if thumbnail_inside:
-                                gs_title_div = thumbnail_inside.find("div", class_="gs-title")
-                                if gs_title_div:
-                                    gs_title_link = gs_title_div.find("a", class_="gs-title", href=True)
-                                    if gs_title_link and 'href' in gs_title_link.attrs:
-                                        link = gs_title_link['href']
-                                        if 'thehindu.com' in link and link not in article_links:
-                                            article_links.append(link)
-                    
                     print(f"Found {len(article_links)} article links on page {page_number}")
                     
-                    # Scrape each article link
-                    for article_url in article_links:
+                    # In incremental mode skip known articles, or revalidate them with conditional GETs
+                    conditional_headers = {}
+                    if incremental:
+                        # Articles fetched earlier in this (resumed) run are not "seen" yet: they were not exported
+                        seen = [link for link in article_links if index.is_seen(category, link, before=sink.started)]
+                        if revalidate:
+                            conditional_headers = {link: index.conditional_headers(category, link) for link in seen}
+                        else:
+                            article_links = [link for link in article_links if link not in seen]
+                        print(f"{len(seen)} of them already indexed")
+                    
+                    # Fetch all article links concurrently (rate limited per host, with retries)
+                    for article_url, article_response, error in fetcher.fetch_all(article_links, conditional_headers):
+                        if error is not None:
+                            print(f"Failed to scrape {article_url}: {error}")
+                            continue
+                        if article_response.status_code == 304:
+                            print(f"Not modified: {article_url}")
+                            continue
                         try:
-                            # Request the article page
-                            article_response = requests.get(article_url)
-                            article_soup = BeautifulSoup(article_response.content, "html.parser")
-                            
-                            # Extract title, subtitle, and author
-                            title = article_soup.find("h1", class_="title").text.strip() if article_soup.find("h1", class_="title") else "No Title"
-                            subtitle = article_soup.find("h2", class_="sub-title").text.strip() if article_soup.find("h2", class_="sub-title") else "No Subtitle"
-                            author = article_soup.find("a", class_="person-name lnk").text.strip() if article_soup.find("a", class_="person-name lnk") else "Miscellaneous"
-                            
-                            # Extract content (from the first two <p> tags inside specific div)
-                            content = ""
-                            content_div = article_soup.find("div", class_=["articlebodycontent", "col-xl-9 col-lg-12 col-md-12 col-sm-12 col-12"])
-                            if content_div:
-                                paragraphs = content_div.find_all("p", limit=2)
-                                content = " ".join([p.text.strip() for p in paragraphs])
+                            article = parse_article(article_response.content)
+                            unique_id = index.record(
+                                category, article_url,
+                                etag=article_response.headers.get('ETag'),
+                                last_modified=article_response.headers.get('Last-Modified'),
+                            )
                             
-                            combined_content = f"{title} {subtitle} {content}"
+                            # Stream the row straight to disk
+                            sink.write({
+                                'title': article['title'],
+                                'subtitle': article['subtitle'],
+                                'author': article['author'],
+                                'content': article['content'],
+                                'link': article_url,
+                                'category': category,
+                                'unique_id': unique_id,
+                            })
+                            category_count += 1
                             
-                            # Append data to lists
-                            titles.append(title)
-                            subtitles.append(subtitle)
-                            authors.append(author)
-                            contents.append(combined_content)
-                            article_urls.append(article_url)
-                            
-                            print(f"Scraped article: {title}")
-                            
-                            # Add a small delay to avoid hitting the server too hard
-                            time.sleep(1)
+                            print(f"Scraped article: {article['title']}")
                             
                         except Exception as e:
                             print(f"Failed to scrape {article_url}: {e}")
                     
-                    # Add a delay between pages
-                    time.sleep(2)
-                    
                 except Exception as e:
                     print(f"Failed to scrape page {page_number}: {e}")
             
-            # Create a DataFrame for this category
-            if titles:  # Check if we have any data
-                data = {
-                    'title': titles,
-                    'subtitle': subtitles,
-                    'author': authors,
-                    'content': contents,
-                    'link': article_urls,
-                    'category': [category] * len(titles)  # Add the category to all rows
-                }
-                
-                category_df = pd.DataFrame(data)
-                all_dfs.append(category_df)
-                
-                print(f"Completed category: {category} - {len(titles)} articles collected")
+            # Checkpoint the finished category
+            sink.mark_done(category, category_count)
+            if category_count:
+                print(f"Completed category: {category} - {category_count} articles collected")
             else:
                 print(f"No articles found for category: {category}")
     
     finally:
-        # Close the Selenium driver
-        driver.quit()
+        index.close()
     
-    # Combine all DataFrames
-    if all_dfs:
-        combined_df = pd.concat(all_dfs, ignore_index=True)
-        
-        # Add unique_id column
-        combined_df['unique_id'] = combined_df.index + 1
-        
-        # Save the combined dataset to CSV
-        combined_df.to_csv(output_csv, index=False, encoding='utf-8')
-        print(f"\nCombined dataset saved as '{output_csv}' with {len(combined_df)} total articles.")
-        return combined_df
+    # Write the combined dataset out of the staging file
+    total = sink.count
+    if total:
+        if incremental and os.path.exists(output_csv):
+            # Append only the new (or changed) articles; readers keep the last row per unique_id
+            sink.export_csv(output_csv, append=True)
+            print(f"\nAppended {total} new articles to '{output_csv}'.")
+        else:
+            # Save the combined dataset to CSV
+            sink.export_csv(output_csv)
+            print(f"\nCombined dataset saved as '{output_csv}' with {total} total articles.")
     else:
-        print("No data was collected for any category. Please check the website structure or search terms.")
-        return pd.DataFrame()
+        sink.discard()
+        if incremental:
+            print("No new articles found.")
+        else:
+            print("No data was collected for any category. Please check the website structure or search terms.")
+    return total
 
 # Example usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape environmental articles from The Hindu.")
+    parser.add_argument("--pages", type=int, default=5, help="Search result pages per category")
+    parser.add_argument("--incremental", action="store_true", help="Only fetch new articles and append them")
+    parser.add_argument("--revalidate", action="store_true", help="With --incremental, re-check known articles via ETag/Last-Modified")
+    parser.add_argument("--browsers", type=int, default=3, help="Parallel headless browsers for search pages")
+    parser.add_argument("--snapshot-dir", default=None, help="Save rendered search pages here")
+    parser.add_argument("--from-snapshots", action="store_true", help="Reuse saved search pages instead of launching a browser")
+    parser.add_argument("--output", default="thehindu_environmental_articles_combined.csv",
+                        help="CSV to write (the app passes the cleaned_file.csv its news page reads)")
+    args = parser.parse_args()
+    if args.from_snapshots and not args.snapshot_dir:
+        parser.error("--from-snapshots requires --snapshot-dir")
+    
     # List of categories to scrape
     categories = [
         "climate change",
@@ -189,7 +169,10 @@ if __name__ == "__main__":
         "eco-friendly living"
     ]
     
-    output_csv = "thehindu_environmental_articles_combined.csv"
+    output_csv = args.output
     
     # Scrape all categories and combine results
-    combined_df = scrape_multiple_categories(categories, output_csv, pages_per_category=5)
\ No newline at end of file
+    total_articles = scrape_multiple_categories(categories, output_csv, pages_per_category=args.pages,
+                                                incremental=args.incremental, revalidate=args.revalidate,
+                                                browsers=args.browsers, snapshot_dir=args.snapshot_dir,
+                                                use_snapshots=args.from_snapshots)
\ No newline at end of file
@@ -0,0 +1,177 @@
+import os
+import re
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from bs4 import BeautifulSoup
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def search_url(category, page_number):
+    """The Hindu's Google CSE search page for a category."""
+    encoded_category = urllib.parse.quote(category)
+    return f"https://www.thehindu.com/search/#gsc.tab=0&gsc.q={encoded_category}&gsc.sort=&gsc.page={page_number}"
+
+
+def extract_article_links(page_source):
+    """
+    Pull thehindu.com article links out of a rendered search results page.
+
+    Returns:
+        list: Unique article links in page order, or None if the results area is missing
+    """
+    soup = BeautifulSoup(page_source, "html.parser")
+
+    # Find the expansion area that contains all results
+    expansion_area = soup.find("div", class_="gsc-expansionArea")
+    if not expansion_area:
+        return None
+
+    article_links = []
+    for item in expansion_area.find_all("div", class_="gsc-webResult gsc-result"):
+        # Navigate through the nested structure
+        gs_web_result = item.find("div", class_="gs-webResult gs-result")
+        if gs_web_result:
+            thumbnail_inside = gs_web_result.find("div", class_="gsc-thumbnail-inside")
+            if thumbnail_inside:
+                gs_title_div = thumbnail_inside.find("div", class_="gs-title")
+                if gs_title_div:
+                    gs_title_link = gs_title_div.find("a", class_="gs-title", href=True)
+                    if gs_title_link and 'href' in gs_title_link.attrs:
+                        link = gs_title_link['href']
+                        if 'thehindu.com' in link and link not in article_links:
+                            article_links.append(link)
+    return article_links
+
+
+class results_settled:
+    """
+    Wait condition: the document is fully loaded and the number of rendered
+    results (or the "no results" marker) has stopped changing between polls.
+    Replaces the old fixed 5 second sleep after every search page.
+    """
+
+    def __init__(self):
+        self.last_count = None
+
+    def __call__(self, driver):
+        if driver.execute_script("return document.readyState") != "complete":
+            return False
+        if not driver.find_elements(By.CLASS_NAME, "gsc-expansionArea"):
+            return False
+        if driver.find_elements(By.CLASS_NAME, "gs-no-results-result"):
+            return True
+        count = len(driver.find_elements(By.CSS_SELECTOR, ".gsc-expansionArea .gsc-webResult.gsc-result"))
+        settled = count > 0 and count == self.last_count
+        self.last_count = count
+        return settled
+
+
+class BrowserPool:
+    """
+    A pool of headless Chrome drivers, one per worker thread, created on first use.
+
+    Args:
+        size (int): Number of parallel browsers
+        timeout (int): Max seconds to wait for a search page to settle
+    """
+
+    def __init__(self, size=3, timeout=20):
+        self.size = size
+        self.timeout = timeout
+        self._local = threading.local()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            chrome_options = Options()
+            chrome_options.add_argument("--headless")  # Run Chrome in headless mode
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--no-sandbox")
+            driver = webdriver.Chrome(options=chrome_options)
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def get_page(self, url):
+        """Load ``url`` and return its HTML once the search results have settled."""
+        driver = self._driver()
+        # Search pages differ only in the #fragment; start from a blank page so results really reload
+        driver.get("about:blank")
+        driver.get(url)
+        WebDriverWait(driver, self.timeout, poll_frequency=0.5).until(results_settled())
+        return driver.page_source
+
+    def close(self):
+        with self._lock:
+            for driver in self._drivers:
+                driver.quit()
+            self._drivers = []
+
+
+def _snapshot_path(snapshot_dir, category, page_number):
+    slug = re.sub(r"[^a-z0-9]+", "-", category.lower()).strip("-")
+    return os.path.join(snapshot_dir, f"{slug}_p{page_number}.html")
+
+
+def collect_search_pages(categories, pages_per_category, workers=3, snapshot_dir=None, use_snapshots=False):
+    """
+    Render every search results page, several browsers in parallel.
+
+    Args:
+        categories (list): Category search terms
+        pages_per_category (int): Result pages per category
+        workers (int): Number of parallel headless browsers
+        snapshot_dir (str): If set, rendered pages are saved here as HTML
+        use_snapshots (bool): Reuse saved snapshots instead of launching a browser for them
+
+    Returns:
+        dict: {(category, page_number): page HTML, or None if it failed}
+    """
+    if use_snapshots and not snapshot_dir:
+        raise ValueError("use_snapshots needs a snapshot_dir to read the saved pages from")
+    tasks = [(category, page) for category in categories for page in range(1, pages_per_category + 1)]
+    pages = {}
+
+    if use_snapshots:
+        for category, page in tasks:
+            path = _snapshot_path(snapshot_dir, category, page)
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    pages[(category, page)] = f.read()
+        print(f"Loaded {len(pages)} search pages from snapshots in '{snapshot_dir}'")
+
+    missing = [task for task in tasks if task not in pages]
+    if not missing:
+        return pages
+
+    pool = BrowserPool(size=workers)
+
+    def render(task):
+        category, page = task
+        print(f"Scraping {category} - Page {page}...")
+        try:
+            return task, pool.get_page(search_url(category, page))
+        except Exception as e:
+            print(f"Failed to scrape page {page} of {category}: {e}")
+            return task, None
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for task, html in executor.map(render, missing):
+                pages[task] = html
+                if html and snapshot_dir:
+                    os.makedirs(snapshot_dir, exist_ok=True)
+                    with open(_snapshot_path(snapshot_dir, *task), "w", encoding="utf-8") as f:
+                        f.write(html)
+    finally:
+        pool.close()
+
+    return pages
@@ -0,0 +1,90 @@
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+
+class SeenIndex:
+    """
+    Persistent index of scraped articles, keyed by (category, url).
+
+    Stores a stable unique_id per article plus the ETag / Last-Modified
+    validators from its last download, so later runs can skip known articles
+    or revalidate them with conditional GETs.
+
+    Args:
+        path (str): SQLite file for the index
+        bootstrap_csv (str): Existing output CSV to seed ids from on first use
+    """
+
+    def __init__(self, path, bootstrap_csv=None):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                category TEXT, url TEXT, unique_id INTEGER UNIQUE,
+                etag TEXT, last_modified TEXT, fetched_at REAL,
+                PRIMARY KEY (category, url)
+            )""")
+        self.conn.commit()
+
+        if bootstrap_csv and os.path.exists(bootstrap_csv) and self.size() == 0:
+            self._bootstrap(bootstrap_csv)
+
+    def _bootstrap(self, csv_path):
+        df = pd.read_csv(csv_path, usecols=['link', 'category', 'unique_id'])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO articles (category, url, unique_id) VALUES (?, ?, ?)",
+            zip(df['category'], df['link'], df['unique_id'].astype(int)),
+        )
+        self.conn.commit()
+        print(f"Seeded article index with {len(df)} articles from '{csv_path}'")
+
+    def size(self):
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def is_seen(self, category, url, before=None):
+        """True if the article is indexed (optionally: fetched before timestamp ``before``)."""
+        if before is None:
+            return self.conn.execute(
+                "SELECT 1 FROM articles WHERE category = ? AND url = ?", (category, url)
+            ).fetchone() is not None
+        return self.conn.execute(
+            "SELECT 1 FROM articles WHERE category = ? AND url = ? AND (fetched_at IS NULL OR fetched_at < ?)",
+            (category, url, before),
+        ).fetchone() is not None
+
+    def conditional_headers(self, category, url):
+        """If-None-Match / If-Modified-Since headers for a seen article (empty dict otherwise)."""
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM articles WHERE category = ? AND url = ?", (category, url)
+        ).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers['If-None-Match'] = row[0]
+        if row and row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def record(self, category, url, etag=None, last_modified=None):
+        """Store validators for an article and return its stable unique_id."""
+        row = self.conn.execute(
+            "SELECT unique_id FROM articles WHERE category = ? AND url = ?", (category, url)
+        ).fetchone()
+        if row:
+            unique_id = row[0]
+            self.conn.execute(
+                "UPDATE articles SET etag = ?, last_modified = ?, fetched_at = ? WHERE unique_id = ?",
+                (etag, last_modified, time.time(), unique_id),
+            )
+        else:
+            unique_id = self.conn.execute("SELECT COALESCE(MAX(unique_id), 0) + 1 FROM articles").fetchone()[0]
+            self.conn.execute(
+                "INSERT INTO articles (category, url, unique_id, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (category, url, unique_id, etag, last_modified, time.time()),
+            )
+        self.conn.commit()
+        return unique_id
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,31 @@
+"""Cross-session cache of generated climate reports.
+
+Reports are keyed by the normalized question plus every setting that shapes
+the prompt, so the same request from any session is answered from disk
+without a Gemini call.
+"""
+import re
+
+from disk_cache import DiskCache, make_key
+
+# Bump whenever the report prompt in final.py changes so old reports are not reused
+REPORT_PROMPT_VERSION = "v1"
+
+
+def normalize_text(text):
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return re.sub(r"\s+", " ", (text or "").strip().lower()).rstrip(" ?!.")
+
+
+def report_key(model_name, question, tone, min_words, max_words, additional_instructions="",
+               specific_sections="", use_search=False, include_tables=True):
+    sections = [normalize_text(line) for line in (specific_sections or "").split("\n") if line.strip()]
+    return make_key(
+        "eco-report", REPORT_PROMPT_VERSION, model_name,
+        normalize_text(question), tone.lower(), int(min_words), int(max_words),
+        normalize_text(additional_instructions), sections, bool(use_search), bool(include_tables),
+    )
+
+
+def default_report_cache():
+    return DiskCache(namespace="eco-reports", ttl=7 * 24 * 3600, max_entries=200)
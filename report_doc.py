@@ -0,0 +1,163 @@
+"""Markdown report -> document tree, shared by the PDF and DOCX exporters.
+
+The Gemini report is parsed once into a flat list of blocks (headings,
+paragraphs, bullet lists, tables), each flagged when it belongs to the
+"Relation with Carbon Footprint" section. Trees are cached by a hash of the
+markdown, so offering both downloads (or rerunning the page) parses it once.
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+CARBON_SECTION_TITLE = "Relation with Carbon Footprint"
+
+_TABLE_SEPARATOR = re.compile(r"^\|[\s:|-]+\|?$")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+
+
+@dataclass
+class Heading:
+    level: int
+    text: str
+    carbon: bool = False
+
+
+@dataclass
+class Paragraph:
+    text: str
+    carbon: bool = False
+
+
+@dataclass
+class BulletList:
+    items: list = field(default_factory=list)
+    carbon: bool = False
+
+
+@dataclass
+class Table:
+    rows: list = field(default_factory=list)
+    carbon: bool = False
+
+
+@dataclass
+class ReportDocument:
+    blocks: list
+    digest: str
+
+
+def inline_spans(text):
+    """Split ``text`` into ``(text, bold)`` runs on **bold** markers."""
+    spans = []
+    pos = 0
+    for match in _BOLD.finditer(text):
+        if match.start() > pos:
+            spans.append((text[pos:match.start()], False))
+        spans.append((match.group(1), True))
+        pos = match.end()
+    if pos < len(text):
+        spans.append((text[pos:], False))
+    return spans
+
+
+def content_hash(markdown_text):
+    return hashlib.sha256(markdown_text.encode("utf-8")).hexdigest()
+
+
+class ReportParser:
+    """Line-by-line markdown parser; ``feed`` lines as they arrive, then ``close``."""
+
+    def __init__(self):
+        self.blocks = []
+        self._list = None
+        self._table = None
+        self._carbon = False
+
+    def _flush(self):
+        if self._list is not None:
+            self.blocks.append(self._list)
+            self._list = None
+        if self._table is not None:
+            self.blocks.append(self._table)
+            self._table = None
+
+    def feed(self, line):
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+
+        if "# " + CARBON_SECTION_TITLE in line:
+            self._flush()
+            self._carbon = True
+            self.blocks.append(Heading(1, line.replace("#", "").strip(), carbon=True))
+            return
+        if self._carbon and (line.startswith("# ") or line.startswith("## ")):
+            self._carbon = False
+
+        # Headings
+        for level, prefix in ((1, "# "), (2, "## "), (3, "### ")):
+            if line.startswith(prefix):
+                self._flush()
+                self.blocks.append(Heading(level, line[len(prefix):].strip(), carbon=self._carbon))
+                return
+
+        # Lists (blank lines between items keep the list open)
+        if stripped.startswith("- ") or stripped.startswith("* "):
+            if self._table is not None:
+                self._flush()
+            if self._list is None:
+                self._list = BulletList(carbon=self._carbon)
+            self._list.items.append(stripped[2:])
+            return
+
+        # Tables
+        if stripped.startswith("|"):
+            if self._list is not None:
+                self._flush()
+            if self._table is None:
+                self._table = Table(carbon=self._carbon)
+            if not _TABLE_SEPARATOR.match(stripped):
+                self._table.rows.append([cell.strip() for cell in stripped.split("|")[1:-1]])
+            return
+
+        if not stripped:
+            if self._table is not None:
+                self._flush()
+            return
+
+        # Regular paragraphs
+        self._flush()
+        self.blocks.append(Paragraph(line.strip(), carbon=self._carbon))
+
+    def close(self):
+        self._flush()
+        return self.blocks
+
+
+def parse_report(markdown_text):
+    """Parse a markdown report into a ReportDocument (uncached)."""
+    parser = ReportParser()
+    for line in markdown_text.split("\n"):
+        parser.feed(line)
+    return ReportDocument(parser.close(), content_hash(markdown_text))
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+CACHE_SIZE = 32
+
+
+def get_document(markdown_text):
+    """Cached parse_report, keyed by the markdown's content hash (LRU of CACHE_SIZE)."""
+    digest = content_hash(markdown_text)
+    with _cache_lock:
+        if digest in _cache:
+            _cache.move_to_end(digest)
+            return _cache[digest]
+    document = parse_report(markdown_text)
+    with _cache_lock:
+        _cache[digest] = document
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return document
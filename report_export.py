@@ -0,0 +1,246 @@
+"""PDF and DOCX renderers for the "Query and Resolve" climate report.
+
+Both walk the same report_doc tree, so the markdown is parsed once per
+report no matter how many formats are produced.
+
+Run ``python report_export.py`` to benchmark parsing and rendering on a
+synthetic 2,000+ word report with many tables.
+"""
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from docx import Document  # type: ignore
+from reportlab.lib import colors  # type: ignore
+from reportlab.lib.pagesizes import letter  # type: ignore
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle  # type: ignore
+
+import report_doc
+
+REPORT_TITLE = "Climate & Carbon Footprint Report"
+
+MIME_TYPES = {
+    "PDF": "application/pdf",
+    "DOCX": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def _pdf_markup(text):
+    return "".join(f"<b>{escape(span)}</b>" if bold else escape(span) for span, bold in report_doc.inline_spans(text))
+
+
+def _pdf_styles():
+    styles = getSampleStyleSheet()
+
+    # Update all styles to include proper wrapping
+    for style_name in styles.byName:
+        styles[style_name].wordWrap = 'CJK'
+        styles[style_name].allowWidows = 0
+        styles[style_name].allowOrphans = 0
+
+    headings = {
+        1: ParagraphStyle(name='CustomHeading1', parent=styles['Heading1'], fontSize=16, spaceAfter=12,
+                          textColor=colors.blue, wordWrap='CJK'),
+        2: ParagraphStyle(name='CustomHeading2', parent=styles['Heading2'], fontSize=14, spaceAfter=10,
+                          textColor=colors.navy, wordWrap='CJK'),
+        3: ParagraphStyle(name='CustomHeading3', parent=styles['Heading3'], fontSize=12, spaceAfter=8,
+                          textColor=colors.darkblue, wordWrap='CJK'),
+    }
+    carbon_section = ParagraphStyle(
+        name='CarbonSection', parent=styles['Normal'], fontSize=12, spaceAfter=8,
+        backColor=colors.lightgreen, borderColor=colors.green, borderWidth=1, borderPadding=5, wordWrap='CJK',
+    )
+    return styles, headings, carbon_section
+
+
+def render_pdf(document):
+    """Render a ReportDocument to a PDF in a BytesIO buffer."""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+    styles, headings, carbon_section = _pdf_styles()
+    available_width = doc.width - doc.leftMargin - doc.rightMargin
+
+    elements = [Paragraph(REPORT_TITLE, styles['Title']), Spacer(1, 12)]
+
+    for block in document.blocks:
+        if isinstance(block, report_doc.Heading):
+            elements.append(Paragraph(_pdf_markup(block.text), headings[block.level]))
+            if block.carbon and block.level == 1:
+                elements.append(Spacer(1, 6))
+        elif isinstance(block, report_doc.BulletList):
+            elements.append(Table([[Paragraph(_pdf_markup(item), styles['Normal'])] for item in block.items]))
+        elif isinstance(block, report_doc.Table):
+            if not block.rows:
+                continue
+            n_cols = max(len(row) for row in block.rows)
+            table_data = [row + [""] * (n_cols - len(row)) for row in block.rows]
+            table = Table(table_data, colWidths=[available_width / n_cols] * n_cols)
+            table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('WORDWRAP', (0, 0), (-1, -1), True)
+            ]))
+            elements.append(table)
+            elements.append(Spacer(1, 12))
+        else:
+            style = carbon_section if block.carbon else styles['Normal']
+            elements.append(Paragraph(_pdf_markup(block.text), style))
+            elements.append(Spacer(1, 6))
+
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
+
+
+def _add_docx_runs(paragraph, text):
+    for span, bold in report_doc.inline_spans(text):
+        paragraph.add_run(span).bold = bold or None
+
+
+def render_docx(document):
+    """Render a ReportDocument to a Word document in a BytesIO buffer."""
+    doc = Document()
+
+    section = doc.sections[0]
+    section.left_margin = 914400 // 8
+    section.right_margin = 914400 // 8
+    table_width = section.page_width - section.left_margin - section.right_margin
+
+    doc.add_heading(REPORT_TITLE, 0)
+
+    for block in document.blocks:
+        if isinstance(block, report_doc.Heading):
+            doc.add_heading(block.text.replace("**", ""), block.level)
+        elif isinstance(block, report_doc.BulletList):
+            paragraph = doc.add_paragraph()
+            for item in block.items:
+                paragraph.add_run('• ')
+                _add_docx_runs(paragraph, item)
+                paragraph.add_run('\n')
+        elif isinstance(block, report_doc.Table):
+            if len(block.rows) < 2:
+                continue
+            n_cols = max(len(row) for row in block.rows)
+            table = doc.add_table(rows=len(block.rows), cols=n_cols)
+            table.style = 'Table Grid'
+            for i, row_data in enumerate(block.rows):
+                cells = table.rows[i].cells
+                for j, cell_data in enumerate(row_data):
+                    cells[j].text = cell_data
+            for cell in table.rows[0].cells:
+                for run in cell.paragraphs[0].runs:
+                    run.bold = True
+            for column in table.columns:
+                column.width = int(table_width / n_cols)
+            doc.add_paragraph()
+        else:
+            para = doc.add_paragraph()
+            _add_docx_runs(para, block.text)
+            if block.carbon:
+                para.style = 'Quote'
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+RENDERERS = {"PDF": render_pdf, "DOCX": render_docx}
+
+
+def export_report(markdown_text, format_type):
+    """Parse (cached) and render ``markdown_text`` as "PDF" or "DOCX"."""
+    return RENDERERS[format_type](report_doc.get_document(markdown_text))
+
+
+class ReportExporter:
+    """
+    Builds report exports on demand and memoizes the bytes by (report hash, format).
+
+    Nothing is rendered until a format is asked for; reruns of the page then
+    reuse the stored bytes. Least recently used exports are dropped once the
+    total size passes ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._exports = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+
+    def get(self, markdown_text, format_type):
+        """Previously built bytes for this report and format, or None."""
+        key = (report_doc.content_hash(markdown_text), format_type)
+        with self._lock:
+            data = self._exports.get(key)
+            if data is not None:
+                self._exports.move_to_end(key)
+                self.hits += 1
+            return data
+
+    def build(self, markdown_text, format_type):
+        """Bytes of the report in ``format_type``, rendering it only if not already built."""
+        data = self.get(markdown_text, format_type)
+        if data is not None:
+            return data
+        data = export_report(markdown_text, format_type).getvalue()
+        key = (report_doc.content_hash(markdown_text), format_type)
+        with self._lock:
+            self.builds += 1
+            if key not in self._exports:
+                self._exports[key] = data
+                self._size += len(data)
+            while self._size > self.max_bytes and len(self._exports) > 1:
+                _, dropped = self._exports.popitem(last=False)
+                self._size -= len(dropped)
+        return data
+
+
+def synthetic_report(sections=12, tables_per_section=2):
+    """A long report in the shape Gemini produces, for benchmarking."""
+    lines = ["# Executive Summary", "This report looks at **household emissions** and how to cut them. " * 6]
+    for s in range(sections):
+        title = report_doc.CARBON_SECTION_TITLE if s == sections // 2 else f"Section {s + 1}"
+        lines += [f"## {title}", "Emissions vary widely between households and regions. " * 8, ""]
+        lines += [f"- Key point {k}: transport, diet and home energy dominate" for k in range(6)]
+        lines.append("")
+        for t in range(tables_per_section):
+            lines += ["### Data", "| Source | Share (%) | tCO2e / year | Trend |", "|---|---|---|---|"]
+            lines += [f"| Source {r} | {r * 3} | {r * 0.4:.1f} | falling |" for r in range(10)]
+            lines.append("")
+    lines += ["## Conclusion", "Small changes add up over a year. " * 10]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import time
+
+    markdown_text = synthetic_report()
+    print(f"Synthetic report: {len(markdown_text.split())} words, "
+          f"{markdown_text.count('|---|')} tables, {len(markdown_text.splitlines())} lines")
+
+    def timed(label, fn, repeat=5):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<28} {best * 1000:8.2f} ms")
+
+    timed("parse (cold)", lambda: report_doc.parse_report(markdown_text))
+    timed("parse (cached)", lambda: report_doc.get_document(markdown_text))
+    document = report_doc.get_document(markdown_text)
+    timed("render PDF", lambda: render_pdf(document), repeat=3)
+    timed("render DOCX", lambda: render_docx(document), repeat=3)
+    timed("both formats, one parse", lambda: [export_report(markdown_text, f) for f in RENDERERS], repeat=3)
+    exporter = ReportExporter()
+    exporter.build(markdown_text, "PDF")
+    timed("memoized export (rerun)", lambda: exporter.build(markdown_text, "PDF"))
@@ -0,0 +1,199 @@
+"""Streaming Gemini report generation for the "Query and Resolve" page.
+
+Chunks are shown as they arrive (whole lines only, throttled), with the
+```markdown fence Gemini sometimes adds stripped on the fly. The final text
+is ``clean_report`` of the full response, which is what the exporters get.
+"""
+import logging
+import time
+
+from suggestions import StubResponse
+
+
+def clean_report(text):
+    """Strip a wrapping ```markdown fence and surrounding whitespace."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def chunk_text(chunk):
+    """Text of one streamed chunk; "" for chunks without parts.
+
+    ``google.generativeai`` raises ValueError from ``.text`` when a chunk has no
+    parts (an empty final chunk, or one stopped by a safety filter), which must
+    not abort a report that has already half-streamed.
+    """
+    try:
+        return chunk.text or ""
+    except (AttributeError, ValueError):
+        return ""
+
+
+class FenceStripper:
+    """Incremental version of clean_report: ``feed`` chunks, get back text that is safe to show.
+
+    Only complete lines are released. A trailing line that is just ``` is held
+    back until more content follows it, since it may be the closing fence.
+    """
+
+    def __init__(self):
+        self._raw = []
+        self._pending = ""
+        self._lead_done = False
+        self.shown = ""
+
+    def feed(self, chunk):
+        self._raw.append(chunk)
+        self._pending += chunk
+
+        if not self._lead_done:
+            head = self._pending.lstrip()
+            if head.startswith("```") or (head and "```".startswith(head)):
+                if "\n" not in head:
+                    self._pending = head
+                    return ""
+                if head.startswith("```"):
+                    head = head.split("\n", 1)[1]
+            elif not head:
+                self._pending = ""
+                return ""
+            self._lead_done = True
+            self._pending = head
+        if not self.shown:
+            self._pending = self._pending.lstrip()
+
+        cut = self._pending.rfind("\n")
+        if cut < 0:
+            return ""
+        body = self._pending[:cut + 1].rstrip()
+        last_line_start = body.rfind("\n") + 1
+        if body[last_line_start:].strip() == "```":
+            body = body[:last_line_start]
+        self._pending = self._pending[len(body):]
+        self.shown += body
+        return body
+
+    def close(self):
+        """The full cleaned text."""
+        return clean_report("".join(self._raw))
+
+
+class ReportStreamer:
+    """
+    Runs one streaming generation and records its latency.
+
+    Args:
+        client: ``genai.GenerativeModel`` or anything with ``generate_content(prompt, stream=True)``
+        min_interval (float): Minimum seconds between display updates
+    """
+
+    def __init__(self, client, min_interval=0.1):
+        self.client = client
+        self.min_interval = min_interval
+        self.ttft = None
+        self.total = None
+        self.chunks = 0
+
+    def run(self, prompt, on_update=None):
+        """Generate the report, calling ``on_update(markdown_so_far)`` as it grows. Returns the final text."""
+        stripper = FenceStripper()
+        start = time.perf_counter()
+        last_update = 0.0
+
+        for chunk in self.client.generate_content(prompt, stream=True):
+            text = chunk_text(chunk)
+            if not text:
+                continue
+            if self.ttft is None:
+                self.ttft = time.perf_counter() - start
+            self.chunks += 1
+            if stripper.feed(text) and on_update is not None:
+                now = time.perf_counter()
+                if now - last_update >= self.min_interval:
+                    on_update(stripper.shown)
+                    last_update = now
+
+        report = stripper.close()
+        self.total = time.perf_counter() - start
+        if on_update is not None:
+            on_update(report)
+        logging.info(f"Report stream: ttft={(self.ttft or 0) * 1000:.0f}ms, total={self.total * 1000:.0f}ms, "
+                     f"chunks={self.chunks}, chars={len(report)}")
+        return report
+
+
+FAKE_REPORT = """```markdown
+# Executive Summary
+Household emissions come mostly from **transport**, **diet** and **home energy**.
+
+## Key Drivers
+- Car travel
+- Red meat
+- Heating and cooling
+
+| Source | Share (%) |
+|---|---|
+| Transport | 30 |
+| Food | 25 |
+
+## Relation with Carbon Footprint
+Every kWh and every kilometre adds to your footprint, and small changes add up.
+
+## Conclusion
+Start with the largest source first.
+```"""
+
+
+class EmptyChunk:
+    """A streamed chunk without parts: ``.text`` raises ValueError, as in google.generativeai."""
+
+    @property
+    def text(self):
+        raise ValueError("The `response.text` quick accessor only works when the response contains a valid `Part`")
+
+
+class FakeStreamingClient:
+    """Offline stand-in for ``genai.GenerativeModel`` that streams a canned report in small chunks.
+
+    With ``empty_final_chunk`` the stream ends with a part-less chunk, like Gemini often does.
+    """
+
+    def __init__(self, text=FAKE_REPORT, chunk_size=24, first_token_delay=0.3, chunk_delay=0.02,
+                 empty_final_chunk=True):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.first_token_delay = first_token_delay
+        self.chunk_delay = chunk_delay
+        self.empty_final_chunk = empty_final_chunk
+        self.calls = 0
+
+    def _chunks(self):
+        time.sleep(self.first_token_delay)
+        for i in range(0, len(self.text), self.chunk_size):
+            if i:
+                time.sleep(self.chunk_delay)
+            yield StubResponse(self.text[i:i + self.chunk_size])
+        if self.empty_final_chunk:
+            yield EmptyChunk()
+
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        if stream:
+            return self._chunks()
+        time.sleep(self.first_token_delay)
+        return StubResponse(self.text)
+
+
+if __name__ == "__main__":
+    for empty_final_chunk in (False, True):
+        streamer = ReportStreamer(FakeStreamingClient(empty_final_chunk=empty_final_chunk), min_interval=0)
+        updates = []
+        report = streamer.run("prompt", on_update=updates.append)
+        assert report == clean_report(FAKE_REPORT)
+        assert all(report.startswith(u.rstrip()) for u in updates[:-1])
+        print(f"empty final chunk={empty_final_chunk}: {len(updates)} updates, "
+              f"ttft {streamer.ttft * 1000:.0f} ms, total {streamer.total * 1000:.0f} ms")
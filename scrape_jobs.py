@@ -0,0 +1,165 @@
+"""Background runner for the news scraper (``python files/new.py``).
+
+At most one scrape runs per host. The job holds an exclusive lock on a
+persistent lock file for as long as the scraper runs: ``flock`` on POSIX,
+where the scraper process inherits the lock, so it stays held even if the app
+that started it dies. The OS drops the lock when its holder exits, so there
+are no stale locks to clean up. Progress is the scraper's own log output;
+status lives in a small JSON file that any session (or ``python scrape_jobs.py
+status``) can read.
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: the lock is held by the app process only
+    fcntl = None
+    import msvcrt
+
+JOBS_DIR = Path(os.getenv("ECOX_JOBS_DIR", ".ecox_jobs"))
+SCRAPER_SCRIPT = Path(__file__).resolve().parent / "python files" / "new.py"
+# The CSV the "Enhance Your Awareness" page reads; the scraper writes it directly
+NEWS_CSV = Path(os.getenv("ECOX_NEWS_CSV", Path(__file__).resolve().parent / "cleaned_file.csv")).resolve()
+
+
+def _try_lock(fd):
+    """Take an exclusive lock on ``fd`` without blocking. Returns False if someone else holds it."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _release(fd):
+    if fcntl is None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    os.close(fd)
+
+
+class ScrapeJob:
+    """
+    Args:
+        script (str): Scraper script, run with its own folder as the working directory
+        base_args (list): Arguments passed on every run, before the per-run ``args``
+    """
+
+    def __init__(self, script=SCRAPER_SCRIPT, name="news-scrape", jobs_dir=JOBS_DIR, cooldown=3600, base_args=()):
+        self.script = str(script)
+        self.base_args = list(base_args)
+        self.name = name
+        self.jobs_dir = Path(jobs_dir)
+        self.cooldown = cooldown
+        self.lock_path = self.jobs_dir / f"{name}.lock"
+        self.status_path = self.jobs_dir / f"{name}.json"
+        self.log_path = self.jobs_dir / f"{name}.log"
+
+    def _acquire_lock(self):
+        """Open descriptor holding the job lock, or None if a scrape already holds it.
+
+        The lock file is never removed, so every caller locks the same inode.
+        """
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        if _try_lock(fd):
+            return fd
+        os.close(fd)
+        return None
+
+    def _write_status(self, **fields):
+        status = self._read_status()
+        status.update(fields)
+        tmp_path = self.status_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(status))
+        os.replace(tmp_path, self.status_path)
+
+    def _read_status(self):
+        try:
+            return json.loads(self.status_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def is_running(self):
+        fd = self._acquire_lock()
+        if fd is None:
+            return True
+        _release(fd)
+        return False
+
+    def start(self, args=(), force=False):
+        """Start the scraper in the background. Returns False if one is already running
+        (on this host) or the last run finished less than ``cooldown`` seconds ago."""
+        last = self._read_status()
+        if not force and last.get("finished") and time.time() - last["finished"] < self.cooldown:
+            return False
+        lock_fd = self._acquire_lock()
+        if lock_fd is None:
+            return False
+
+        try:
+            log = open(self.log_path, "w")
+            proc = subprocess.Popen(
+                [sys.executable, "-u", self.script, *self.base_args, *args],
+                stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                cwd=os.path.dirname(os.path.abspath(self.script)),
+                # The scraper inherits the flock, so the lock lives exactly as long as the scrape
+                pass_fds=(lock_fd,) if fcntl is not None else (),
+            )
+        except Exception:
+            _release(lock_fd)
+            raise
+        self._write_status(state="running", pid=proc.pid, args=list(args),
+                           started=time.time(), finished=None, returncode=None)
+
+        def wait():
+            returncode = proc.wait()
+            log.close()
+            self._write_status(state="succeeded" if returncode == 0 else "failed",
+                               finished=time.time(), returncode=returncode)
+            _release(lock_fd)
+
+        threading.Thread(target=wait, name=f"{self.name}-watcher", daemon=True).start()
+        return True
+
+    def last_log_line(self):
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 4096))
+                lines = [line.strip() for line in f.read().decode("utf-8", "replace").splitlines() if line.strip()]
+        except OSError:
+            return ""
+        return lines[-1] if lines else ""
+
+    def status(self):
+        """Current job status: state (idle/running/succeeded/failed), timings and last progress line."""
+        status = {"state": "idle", **self._read_status()}
+        if status["state"] == "running" and not self.is_running():
+            # The app that launched it died before recording the outcome
+            status["state"] = "failed"
+        status["progress"] = self.last_log_line()
+        return status
+
+
+def news_scrape_job():
+    """The job behind the news page: new.py writing straight to NEWS_CSV."""
+    return ScrapeJob(SCRAPER_SCRIPT, base_args=["--output", str(NEWS_CSV)])
+
+
+if __name__ == "__main__":
+    job = news_scrape_job()
+    if len(sys.argv) > 1 and sys.argv[1] == "start":
+        print("started" if job.start(sys.argv[2:], force=True) else "already running")
+    else:
+        print(json.dumps(job.status(), indent=2))
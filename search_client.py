@@ -0,0 +1,149 @@
+"""One Google Custom Search client for the whole app.
+
+A single pooled HTTP session with timeouts, results cached on disk with a
+TTL, and concurrent identical queries coalesced into one upstream call (the
+first caller fetches, the others wait for its result).
+
+Run ``python search_client.py`` to check the coalescing against a local mock
+server.
+"""
+import os
+import threading
+from concurrent.futures import Future
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from disk_cache import DiskCache, make_key
+
+SEARCH_URL = os.getenv("ECOX_SEARCH_URL", "https://www.googleapis.com/customsearch/v1")
+
+# Placeholders used when the keys are not configured
+_MISSING = {None, "", "API_KEY_NOT_FOUND", "CSE_ID_NOT_FOUND"}
+
+
+class SearchClient:
+    """
+    Args:
+        api_key (str): Custom Search API key (default: GOOGLE_SEARCH_API_KEY, then GOOGLE_API_KEY)
+        cse_id (str): Search engine id (default: GOOGLE_CSE_ID)
+        base_url (str): Endpoint, overridable for a mock server
+        cache (DiskCache): Result cache, or None to disable
+        timeout: requests timeout, (connect, read) seconds
+        pool_size (int): Connections kept open to the search host
+    """
+
+    def __init__(self, api_key=None, cse_id=None, base_url=SEARCH_URL, cache=None, timeout=(3.05, 10), pool_size=8):
+        self.api_key = api_key or os.getenv("GOOGLE_SEARCH_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        self.cse_id = cse_id or os.getenv("GOOGLE_CSE_ID")
+        self.base_url = base_url
+        self.cache = cache
+        self.timeout = timeout
+        self.upstream_calls = 0
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    @property
+    def configured(self):
+        return self.api_key not in _MISSING and self.cse_id not in _MISSING
+
+    def _key(self, query, num_results):
+        return make_key("cse", self.base_url, self.cse_id, " ".join(query.lower().split()), num_results)
+
+    def _fetch(self, query, num_results):
+        with self._lock:
+            self.upstream_calls += 1
+        response = self.session.get(
+            self.base_url,
+            params={"key": self.api_key, "cx": self.cse_id, "q": query, "num": num_results},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return [
+            {"title": item.get("title", ""), "link": item.get("link", ""), "snippet": item.get("snippet", "")}
+            for item in response.json().get("items", [])
+        ]
+
+    def search(self, query, num_results=10):
+        """
+        Search results as a list of {title, link, snippet} dicts.
+
+        Returns None when the API credentials are not configured; raises on request errors.
+        """
+        if not self.configured:
+            return None
+        num_results = max(1, min(int(num_results), 10))  # the API serves at most 10 per request
+        key = self._key(query, num_results)
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            # A leader that finished just before we took the lock may have filled the cache;
+            # this miss was already counted above
+            results = self.cache.get(key, count=False) if self.cache is not None else None
+            if results is None:
+                results = self._fetch(query, num_results)
+                if self.cache is not None:
+                    self.cache.set(key, results)
+            future.set_result(results)
+            return results
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+def default_search_client():
+    return SearchClient(cache=DiskCache(namespace="web-search", ttl=6 * 3600, max_entries=1000))
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MockSearch(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(0.3)
+            body = json.dumps({"items": [{"title": f"Result {i}", "link": f"https://example.org/{i}", "snippet": "..."}
+                                         for i in range(5)]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockSearch)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = SearchClient(api_key="test", cse_id="test", base_url=f"http://127.0.0.1:{server.server_address[1]}/")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(lambda _: client.search("carbon footprint"), range(20)))
+    print(f"20 concurrent identical searches: {client.upstream_calls} upstream call(s), "
+          f"{time.perf_counter() - start:.2f}s, {len(results[0])} results each")
+    server.shutdown()
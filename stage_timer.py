@@ -0,0 +1,43 @@
+import logging
+import time
+
+# Stages of the "Calculate Footprint" pipeline, in order
+PIPELINE_STAGES = ["encode", "predict", "impact", "map", "suggestions"]
+
+
+class StageTimer:
+    """Times consecutive pipeline stages and reports real progress between them.
+
+    ``start(name)`` closes the running stage and opens the next one, so it can
+    be dropped between existing blocks of code without re-indenting them.
+    """
+
+    def __init__(self, stages=PIPELINE_STAGES, on_progress=None):
+        self.stages = list(stages)
+        self.on_progress = on_progress
+        self.timings = {}
+        self._current = None
+        self._started = None
+        self._t0 = time.perf_counter()
+
+    def start(self, name):
+        self._stop()
+        self._current = name
+        self._started = time.perf_counter()
+        if self.on_progress is not None:
+            self.on_progress(len(self.timings) / len(self.stages), f"Running: {name}...")
+
+    def _stop(self):
+        if self._current is None:
+            return
+        self.timings[self._current] = time.perf_counter() - self._started
+        self._current = None
+        if self.on_progress is not None:
+            self.on_progress(min(1.0, len(self.timings) / len(self.stages)), "Done" if len(self.timings) >= len(self.stages) else None)
+
+    def finish(self):
+        """Close the last stage, log the breakdown and return ``{stage: seconds}``."""
+        self._stop()
+        self.timings["total"] = time.perf_counter() - self._t0
+        logging.info("Stage timings: " + ", ".join(f"{k}={v * 1000:.1f}ms" for k, v in self.timings.items()))
+        return self.timings
@@ -0,0 +1,106 @@
+"""Concurrent, cached Gemini suggestions for the footprint results page."""
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from disk_cache import DiskCache, make_key
+
+# Bump whenever build_prompt changes so old cached answers are not reused
+PROMPT_VERSION = "v1"
+
+
+def build_prompt(issue):
+    return f"""
+    Generate a suggestion for someone who {issue}.
+    Format it as a problem statement followed by a specific actionable solution.
+    Make it detailed and conversational but not more than 3 bullets under each 'what you can do'.
+    Ensure no extra text is displayed before and after it.
+    Problem should be summarised in 2 sentences.
+    Each bullet should have 2-3 sentences for explanation.
+    What you can do should have a pointer followed by ':' followed by explanation.
+    Example format: "Problem: [brief issue]. What you can do: [specific action]"
+    """
+
+
+def fallback_suggestion(issue):
+    """Static suggestion used when the API fails (None if there is none for this issue)."""
+    if "gasoline" in issue:
+        return "Problem: Gas vehicles emit CO2. What you can do: Try carpooling or public transit twice a week."
+    if "screen" in issue:
+        return "Problem: High screen time uses electricity. What you can do: Set device-free hours and use power-saving modes."
+    return None
+
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubClient:
+    """Offline stand-in for ``genai.GenerativeModel`` with an optional fake latency."""
+
+    def __init__(self, delay=0.0, fail_on=()):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        time.sleep(self.delay)
+        if any(trigger in prompt for trigger in self.fail_on):
+            raise RuntimeError("stub failure")
+        issue = prompt.split("someone who", 1)[-1].split(".", 1)[0].strip()
+        return StubResponse(f"Problem: You {issue}. What you can do: Stub suggestion.")
+
+
+class SuggestionEngine:
+    """Generates one suggestion per trigger with bounded parallelism and a disk cache."""
+
+    def __init__(self, client, cache=None, max_workers=4):
+        self.client = client
+        self.cache = cache
+        self.max_workers = max_workers
+
+    def _key(self, issue):
+        return make_key("eco-suggestion", PROMPT_VERSION, issue)
+
+    def _fetch(self, issue):
+        text = self.client.generate_content(build_prompt(issue)).text.strip()
+        if self.cache is not None:
+            self.cache.set(self._key(issue), text)
+        return text
+
+    def generate_one(self, issue):
+        if self.cache is not None:
+            cached = self.cache.get(self._key(issue))
+            if cached is not None:
+                return cached
+        return self._fetch(issue)
+
+    def stream(self, issues):
+        """Yield ``(index, issue, text, error)`` as each suggestion finishes.
+
+        Cached suggestions come back first, without touching the thread pool.
+        """
+        pending = []
+        for i, issue in enumerate(issues):
+            cached = self.cache.get(self._key(issue)) if self.cache is not None else None
+            if cached is not None:
+                yield i, issue, cached, None
+            else:
+                pending.append((i, issue))
+
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+            futures = {pool.submit(self._fetch, issue): (i, issue) for i, issue in pending}
+            for future in as_completed(futures):
+                i, issue = futures[future]
+                try:
+                    yield i, issue, future.result(), None
+                except Exception as e:
+                    yield i, issue, None, e
+
+
+def default_cache():
+    return DiskCache(namespace="eco-suggestions", ttl=30 * 24 * 3600, max_entries=500)